@@ -4,14 +4,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+import aiohttp
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import (
     SuperiorPlusPropaneApiClientError,
     create_api_client,
+    get_session_headers,
 )
 from .const import CONF_INCLUDE_UNMONITORED, CONF_REGION, LOGGER
 from .coordinator import SuperiorPlusPropaneDataUpdateCoordinator
@@ -19,14 +25,31 @@ from .data import SuperiorPlusPropaneData
 from .region import get_region_config
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
 
     from .data import SuperiorPlusPropaneConfigEntry
+    from .region import RegionConfig
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
+# DNS cache for the integration's own session; pool sizing is per region
+_CONNECTOR_DNS_CACHE_TTL = 300
+
+
+def _create_session(region_config: RegionConfig) -> aiohttp.ClientSession:
+    """Create a dedicated client session with a tuned connection pool."""
+    return aiohttp.ClientSession(
+        headers=get_session_headers(region_config.region),
+        connector=aiohttp.TCPConnector(
+            limit=region_config.max_connections,
+            limit_per_host=region_config.max_connections,
+            ttl_dns_cache=_CONNECTOR_DNS_CACHE_TTL,
+            keepalive_timeout=region_config.keepalive_timeout,
+        ),
+    )
+
 
 async def async_migrate_entry(
     hass: HomeAssistant,
@@ -54,38 +77,49 @@ async def async_setup_entry(
     """Set up this integration using UI."""
     region = entry.data.get(CONF_REGION, "us")
     region_config = get_region_config(region)
-
-    client = create_api_client(
-        region=region,
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-        session=async_create_clientsession(hass),
-        region_config=region_config,
-    )
-
-    coordinator = SuperiorPlusPropaneDataUpdateCoordinator(
-        hass=hass,
-        config_entry=entry,
-        region_config=region_config,
-    )
-
-    entry.runtime_data = SuperiorPlusPropaneData(
-        client=client,
-        integration=async_get_loaded_integration(hass, entry.domain),
-        coordinator=coordinator,
-        region_config=region_config,
-    )
-
-    # Load stored consumption data before first refresh
-    await coordinator.async_load_consumption_data()
+    session = _create_session(region_config)
 
     try:
+        client = create_api_client(
+            region=region,
+            username=entry.data[CONF_USERNAME],
+            password=entry.data[CONF_PASSWORD],
+            session=session,
+            region_config=region_config,
+        )
+
+        coordinator = SuperiorPlusPropaneDataUpdateCoordinator(
+            hass=hass,
+            config_entry=entry,
+            region_config=region_config,
+        )
+
+        entry.runtime_data = SuperiorPlusPropaneData(
+            client=client,
+            session=session,
+            integration=async_get_loaded_integration(hass, entry.domain),
+            coordinator=coordinator,
+            region_config=region_config,
+        )
+
+        # Load stored consumption data before first refresh
+        await coordinator.async_load_consumption_data()
         await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed:
-        raise
     except SuperiorPlusPropaneApiClientError as exc:
+        await session.close()
         msg = f"Failed to set up {entry.domain}: {exc}"
         raise ConfigEntryNotReady(msg) from exc
+    except Exception:
+        await session.close()
+        raise
+
+    async def _async_close_session(_event: Event) -> None:
+        """Close the entry's session; entries are not unloaded at shutdown."""
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -98,10 +132,13 @@ async def async_unload_entry(
     entry: SuperiorPlusPropaneConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    if entry.runtime_data and entry.runtime_data.client:
-        await entry.runtime_data.client.async_close()
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok and entry.runtime_data:
+        # Flush any consumption save still waiting on its write delay
+        await entry.runtime_data.coordinator.async_shutdown()
+        await entry.runtime_data.session.close()
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    return unload_ok
 
 
 async def async_reload_entry(
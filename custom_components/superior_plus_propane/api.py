@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import aiohttp
 
     from .region import RegionConfig
 
 # HTTP Status Codes
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
 
 # Error messages
 SESSION_EXPIRED_MSG = "Session expired"
@@ -36,6 +41,11 @@ class SuperiorPlusPropaneApiClientAuthenticationError(
 class SuperiorPropaneApiBase(ABC):
     """Abstract base for region-specific API clients."""
 
+    # Static headers a session dedicated to this client may carry as its
+    # defaults. Clients only send the headers their session does not already
+    # carry, so a plain shared session still gets the full set per request.
+    SESSION_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({})
+
     def __init__(
         self,
         username: str,
@@ -49,7 +59,15 @@ class SuperiorPropaneApiBase(ABC):
         self._session = session
         self._region_config = region_config
         self._authenticated = False
-        self._auth_in_progress = False
+        # Serializes logins so concurrent requests share one auth attempt
+        self._auth_lock = asyncio.Lock()
+
+    def _without_session_headers(self, headers: Mapping[str, str]) -> dict[str, str]:
+        """Return the headers the session does not already send by default."""
+        defaults = self._session.headers
+        return {
+            key: value for key, value in headers.items() if defaults.get(key) != value
+        }
 
     @abstractmethod
     async def async_get_tanks_data(self) -> list[dict[str, Any]]:
@@ -59,6 +77,20 @@ class SuperiorPropaneApiBase(ABC):
         """Get orders data. Override in subclasses that support it."""
         return {}
 
+    async def async_get_all(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Get tank and orders data concurrently."""
+        tanks_task = asyncio.create_task(self.async_get_tanks_data())
+        try:
+            orders = await self.async_get_orders_data()
+        except BaseException:
+            tanks_task.cancel()
+            # Settle the tank fetch so its outcome is never left unobserved
+            await asyncio.wait([tanks_task])
+            if not tanks_task.cancelled():
+                tanks_task.exception()
+            raise
+        return await tanks_task, orders
+
     async def async_test_connection(self) -> bool:
         """Test connection by fetching tanks."""
         try:
@@ -70,10 +102,30 @@ class SuperiorPropaneApiBase(ABC):
         else:
             return len(tanks) > 0
 
-    async def async_close(self) -> None:
-        """Close the API client session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+
+# Region client classes, imported on first use
+_CLIENT_CACHE: dict[str, type[SuperiorPropaneApiBase]] = {}
+
+
+def _get_client_class(region: str) -> type[SuperiorPropaneApiBase]:
+    """Return the API client class for a region, importing it once."""
+    client_class = _CLIENT_CACHE.get(region)
+    if client_class is None:
+        if region == "ca":
+            from .api_ca import SuperiorPropaneCAApiClient
+
+            client_class = SuperiorPropaneCAApiClient
+        else:
+            from .api_us import SuperiorPropaneUSApiClient
+
+            client_class = SuperiorPropaneUSApiClient
+        _CLIENT_CACHE[region] = client_class
+    return client_class
+
+
+def get_session_headers(region: str) -> Mapping[str, str]:
+    """Return the default headers for a session dedicated to a region."""
+    return _get_client_class(region).SESSION_HEADERS
 
 
 def create_api_client(
@@ -84,11 +136,4 @@ def create_api_client(
     region_config: RegionConfig,
 ) -> SuperiorPropaneApiBase:
     """Create the appropriate API client for the given region."""
-    if region == "ca":
-        from .api_ca import SuperiorPropaneCAApiClient
-
-        return SuperiorPropaneCAApiClient(username, password, session, region_config)
-
-    from .api_us import SuperiorPropaneUSApiClient
-
-    return SuperiorPropaneUSApiClient(username, password, session, region_config)
+    return _get_client_class(region)(username, password, session, region_config)
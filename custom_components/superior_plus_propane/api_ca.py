@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import html
+import random
+import re
+import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
 
 from .api import (
     HTTP_OK,
@@ -18,6 +24,8 @@ from .api import (
 from .const import LOGGER
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import aiohttp
 
     from .region import RegionConfig
@@ -29,16 +37,99 @@ _LOGIN_URL = "https://mysuperior.superiorpropane.com/account/loginFirst"
 _ORDERS_URL = "https://mysuperior.superiorpropane.com/myaccount/getAllOrders"
 _TANK_DATA_URL = "https://mysuperior.superiorpropane.com/myaccount/readTanks"
 
+# Browser headers shared by every request
+_STATIC_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "accept-language": "en-US,en;q=0.9,fr-CA;q=0.8",
+        "cache-control": "no-cache",
+        "pragma": "no-cache",
+        "origin": "https://mysuperior.superiorpropane.com",
+        "sec-ch-ua": (
+            '"Chromium";v="129", "Not=A?Brand";v="8", "Google Chrome";v="129"'
+        ),
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"Windows"',
+        "sec-fetch-dest": "document",
+        "sec-fetch-mode": "navigate",
+        "sec-fetch-site": "same-origin",
+        "sec-fetch-user": "?1",
+        "upgrade-insecure-requests": "1",
+        "user-agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/129.0.0.0 Safari/537.36"
+        ),
+    }
+)
+
 # Pagination
 _TANK_PAGE_SIZE = 10
 
 # Magic number threshold for order columns
 _ORDER_COLUMN_COUNT = 5
 
+# Order rows and their column divs in the orders HTML
+_XP_ORDER_ROWS = etree.XPath("//div[normalize-space(@class)='orders__row cf']")
+_XP_ORDER_COLUMNS = etree.XPath(".//div")
+
+# Normalized key, portal key and default for tank fields copied as strings
+_STR_FIELDS = (
+    ("tank_id", "adds_tank_id", "unknown"),
+    ("tank_size", "adds_tank_size", "unknown"),
+    ("customer_number", "adds_customer_number", "unknown"),
+    ("level", "adds_fill_percentage", "unknown"),
+    ("current_volume", "adds_fill", "unknown"),
+    ("reading_date", "adds_last_reading", "unknown"),
+)
+
+# The plain markup the portal renders for an order row: five text-only divs
+_RE_ORDER_ROW = re.compile(
+    r'<div class="orders__row cf">'
+    + r"\s*<div[^>]*>([^<]*)</div>" * _ORDER_COLUMN_COUNT
+    + r"\s*</div>"
+)
+
+# Currency and thousands separators dropped from order amounts
+_NUM_TBL = str.maketrans("", "", "$,")
+
+# Backoff for CSRF and login retries, in seconds
+_AUTH_BACKOFF_BASE = 1.0
+_AUTH_BACKOFF_CAP = 30.0
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return a jittered exponential backoff delay for a retry attempt."""
+    return min(cap, base * 2**attempt) * random.uniform(0.5, 1.5)  # noqa: S311
+
+
+def _as_str(value: Any, default: str) -> str:
+    """Return a portal value as a string, using default when it is missing."""
+    if isinstance(value, str):
+        return value
+    return default if value is None else str(value)
+
+
+def _order_rows(data_html: str) -> list[tuple[str, ...]]:
+    """Return the column texts of each five-column order row."""
+    matches = _RE_ORDER_ROW.findall(data_html)
+    if len(matches) == data_html.count("orders__row"):
+        return [tuple(html.unescape(col) for col in match) for match in matches]
+
+    # Some row is marked up differently; parse the document instead
+    rows = []
+    for row in _XP_ORDER_ROWS(lxml_html.fromstring(data_html)):
+        cols = _XP_ORDER_COLUMNS(row)
+        if len(cols) == _ORDER_COLUMN_COUNT:
+            rows.append(tuple(col.text_content() for col in cols))
+    return rows
+
 
 class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
     """Canadian Superior Propane API Client — JSON + HTML endpoints."""
 
+    SESSION_HEADERS = _STATIC_HEADERS
+
     def __init__(
         self,
         username: str,
@@ -48,73 +139,73 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
     ) -> None:
         """Initialize the CA API client."""
         super().__init__(username, password, session, region_config)
-        self._headers = {
-            "accept": (
-                "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
-            ),
-            "accept-language": "en-US,en;q=0.9,fr-CA;q=0.8",
-            "cache-control": "no-cache",
-            "pragma": "no-cache",
-            "origin": "https://mysuperior.superiorpropane.com",
-            "sec-ch-ua": (
-                '"Chromium";v="129", "Not=A?Brand";v="8", "Google Chrome";v="129"'
-            ),
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "document",
-            "sec-fetch-mode": "navigate",
-            "sec-fetch-site": "same-origin",
-            "sec-fetch-user": "?1",
-            "upgrade-insecure-requests": "1",
-            "user-agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/129.0.0.0 Safari/537.36"
-            ),
+        self._headers = self._without_session_headers(_STATIC_HEADERS)
+        # Form posts made by the portal's own scripts
+        self._login_headers = {
+            **self._headers,
+            "content-type": "application/x-www-form-urlencoded",
+            "referer": _LOGIN_PAGE_URL,
+            "x-requested-with": "XMLHttpRequest",
+        }
+        self._api_headers = {
+            **self._headers,
+            "content-type": "application/x-www-form-urlencoded",
+            "referer": _DASHBOARD_URL,
+            "x-requested-with": "XMLHttpRequest",
         }
+        # Only the CSRF token changes between logins
+        self._login_fields = {
+            "login_email": username,
+            "login_password": password,
+        }
+        # Monotonic deadline until which a login is reused without checks
+        self._auth_expires_at = 0.0
 
     async def async_get_tanks_data(self) -> list[dict[str, Any]]:
-        """Get tank data — clears cookies and re-auths every call."""
-        self._session.cookie_jar.clear()
-        self._authenticated = False
-        await self._ensure_authenticated()
-        return await self._get_tanks_from_api()
+        """Get tank data — clears cookies and re-auths unless auth is fresh."""
+        try:
+            await self._ensure_session()
+            return await self._get_tanks_from_api()
+        except Exception:
+            # Never reuse a session that just failed
+            self._auth_expires_at = 0.0
+            raise
+
+    async def async_get_all(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Get tank and then orders data; every POST may rotate the CSRF token."""
+        tanks = await self.async_get_tanks_data()
+        return tanks, await self.async_get_orders_data()
 
     async def async_get_orders_data(self) -> dict[str, Any]:
         """Get orders data from the CA portal."""
+        await self._ensure_session()
         return await self._get_orders_totals()
 
+    async def _ensure_session(self) -> None:
+        """Start from a clean login unless the current one is fresh."""
+        async with self._auth_lock:
+            if not self._auth_is_fresh():
+                self._session.cookie_jar.clear()
+                self._authenticated = False
+            await self._ensure_authenticated()
+
+    def _auth_is_fresh(self) -> bool:
+        """Return True if the last successful login is within the auth TTL."""
+        return self._authenticated and time.monotonic() < self._auth_expires_at
+
     async def _ensure_authenticated(self) -> None:
         """Ensure we have a valid authenticated session."""
-        if self._authenticated:
-            try:
-                async with asyncio.timeout(60):
-                    response = await self._session.get(
-                        _DASHBOARD_URL,
-                        headers=self._headers,
-                        allow_redirects=True,
-                    )
-                    if "individualLogin" in str(response.url):
-                        LOGGER.debug("Redirected to login, re-authenticating")
-                        self._authenticated = False
-                    if response.status != HTTP_OK:
-                        LOGGER.debug("HTTP failed, re-authenticating")
-                        self._authenticated = False
-            except Exception as exc:  # noqa: BLE001
-                LOGGER.warning("Error validating CA session: %s", exc)
-                self._authenticated = False
+        # A stale login is dropped by _ensure_session rather than probed, so
+        # anything not fresh here needs a new login.
+        if self._auth_is_fresh():
+            return
 
-        if not self._authenticated:
-            await self._authenticate()
-            if self._region_config.auth_settle_delay > 0:
-                await asyncio.sleep(self._region_config.auth_settle_delay)
+        await self._authenticate()
+        if self._region_config.auth_settle_delay > 0:
+            await asyncio.sleep(self._region_config.auth_settle_delay)
 
     async def _authenticate(self) -> None:
         """Perform CA authentication sequence."""
-        if self._auth_in_progress:
-            return
-
-        self._auth_in_progress = True
         try:
             LOGGER.debug("Starting CA authentication sequence")
 
@@ -124,6 +215,7 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                     headers=self._headers,
                     allow_redirects=True,
                 )
+                # Maintenance may be signalled by host or query, not just path
                 if "maintenance" in str(response.url):
                     msg = "Site under scheduled maintenance"
                     raise SuperiorPlusPropaneApiClientCommunicationError(msg)  # noqa: TRY301
@@ -140,6 +232,9 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
             await self._login(csrf_token)
 
             self._authenticated = True
+            self._auth_expires_at = (
+                time.monotonic() + self._region_config.auth_ttl_seconds
+            )
             LOGGER.debug("CA authentication successful")
 
         except (
@@ -153,15 +248,22 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
             self._authenticated = False
             msg = f"Authentication failed: {exc}"
             raise SuperiorPlusPropaneApiClientAuthenticationError(msg) from exc
-        finally:
-            self._auth_in_progress = False
 
-    async def _get_csrf_token(self) -> str | None:
-        """Get CSRF token from cookies ('csrf_cookie_name')."""
+    def _read_csrf_cookie(self) -> str | None:
+        """Read the CSRF token from the 'csrf_cookie_name' cookie."""
         for cookie in self._session.cookie_jar:
             if cookie.key == "csrf_cookie_name":
-                LOGGER.debug("Found CSRF token in cookie")
                 return cookie.value
+        return None
+
+    async def _get_csrf_token(self) -> str | None:
+        """Get CSRF token from cookies ('csrf_cookie_name')."""
+        # Read from the jar on every request: the portal may rotate the
+        # token with each POST
+        csrf_token = self._read_csrf_cookie()
+        if csrf_token:
+            LOGGER.debug("Found CSRF token in cookie")
+            return csrf_token
 
         LOGGER.debug("CSRF cookie not found — fetching login page")
         retries = self._region_config.max_api_retries
@@ -175,17 +277,19 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                         msg = f"Failed to get login page: {response.status}"
                         raise SuperiorPlusPropaneApiClientCommunicationError(msg)  # noqa: TRY301
 
-                for cookie in self._session.cookie_jar:
-                    if cookie.key == "csrf_cookie_name":
-                        LOGGER.debug("CSRF token obtained after page load")
-                        return cookie.value
+                csrf_token = self._read_csrf_cookie()
+                if csrf_token:
+                    LOGGER.debug("CSRF token obtained after page load")
+                    return csrf_token
 
                 LOGGER.warning("CSRF token still not found (attempt %d)", attempt)
                 if attempt == retries:
                     msg = "CSRF cookie 'csrf_cookie_name' not found"
                     raise SuperiorPlusPropaneApiClientAuthenticationError(msg)
 
-                await asyncio.sleep(3 + (attempt * 2))
+                await asyncio.sleep(
+                    _backoff_delay(attempt, _AUTH_BACKOFF_BASE, _AUTH_BACKOFF_CAP)
+                )
 
             except (
                 TimeoutError,
@@ -204,20 +308,7 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
 
     async def _login(self, csrf_token: str) -> None:
         """Perform CA login with CSRF token."""
-        payload = {
-            "csrf_superior_token": csrf_token,
-            "login_email": self._username,
-            "login_password": self._password,
-        }
-
-        login_headers = self._headers.copy()
-        login_headers.update(
-            {
-                "content-type": "application/x-www-form-urlencoded",
-                "referer": _LOGIN_PAGE_URL,
-                "x-requested-with": "XMLHttpRequest",
-            }
-        )
+        payload = {"csrf_superior_token": csrf_token, **self._login_fields}
 
         retries = self._region_config.max_api_retries
         for attempt in range(1, retries + 1):
@@ -225,16 +316,16 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                 async with asyncio.timeout(60):
                     response = await self._session.post(
                         _LOGIN_URL,
-                        headers=login_headers,
+                        headers=self._login_headers,
                         data=payload,
                         allow_redirects=True,
                     )
 
-                if "dashboard" in str(response.url):
+                if "dashboard" in response.url.path:
                     LOGGER.debug("CA login successful — redirected to dashboard")
                     return
 
-                if "individualLogin" in str(response.url):
+                if "individualLogin" in response.url.path:
                     msg = "Login failed — redirected to login"
                     raise SuperiorPlusPropaneApiClientAuthenticationError(msg)  # noqa: TRY301
 
@@ -247,138 +338,159 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                 if attempt == retries:
                     msg = "Login timeout after retries"
                     raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
-                await asyncio.sleep(3 + (attempt * 2))
+                await asyncio.sleep(
+                    _backoff_delay(attempt, _AUTH_BACKOFF_BASE, _AUTH_BACKOFF_CAP)
+                )
 
             except SuperiorPlusPropaneApiClientAuthenticationError:
                 if attempt == retries:
                     raise
-                await asyncio.sleep(3 + (attempt * 2))
+                await asyncio.sleep(
+                    _backoff_delay(attempt, _AUTH_BACKOFF_BASE, _AUTH_BACKOFF_CAP)
+                )
+
+    def _data_backoff_delay(self, attempt: int) -> float:
+        """Backoff before retrying a data request, scaled by the retry delay."""
+        retry_delay = self._region_config.retry_delay_seconds
+        return _backoff_delay(attempt, retry_delay / 4, retry_delay * 2)
+
+    async def _get_tanks_from_api(self) -> list[dict[str, Any]]:
+        """Get tank data from the CA JSON API within the overall time budget."""
+        budget = self._region_config.tank_fetch_timeout
+        try:
+            async with asyncio.timeout(budget):
+                return await self._get_tank_pages()
+        except TimeoutError as exc:
+            msg = f"Tank fetch did not finish within {budget}s"
+            raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
 
-    async def _get_tanks_from_api(self) -> list[dict[str, Any]]:  # noqa: PLR0912, PLR0915
+    async def _get_tank_pages(self) -> list[dict[str, Any]]:
         """Get tank data from the CA JSON API (paginated)."""
         tanks_data: list[dict[str, Any]] = []
         offset = 0
-        finished = False
-
-        while not finished:
-            retries = self._region_config.max_api_retries
-            for attempt in range(1, retries + 1):
-                try:
-                    csrf_token = await self._get_csrf_token()
-                    payload = {
-                        "csrf_superior_token": csrf_token,
-                        "limit": str(_TANK_PAGE_SIZE),
-                        "offset": str(offset),
-                        "firstRun": "true" if offset == 0 else "false",
-                        "listIndex": str(offset + 1),
-                    }
-
-                    api_headers = self._headers.copy()
-                    api_headers.update(
-                        {
-                            "content-type": ("application/x-www-form-urlencoded"),
-                            "referer": _DASHBOARD_URL,
-                            "x-requested-with": "XMLHttpRequest",
-                        }
+
+        # One page at a time: every POST may rotate the CSRF token
+        while True:
+            try:
+                page = await self._fetch_tank_page(offset)
+            except SuperiorPlusPropaneApiClientAuthenticationError:
+                raise
+            except SuperiorPlusPropaneApiClientError:
+                if tanks_data:
+                    LOGGER.warning(
+                        "API error but returning %d tanks collected",
+                        len(tanks_data),
                     )
+                    return tanks_data
+                raise
+            if self._collect_tank_page(page, offset, tanks_data):
+                LOGGER.debug("Parsed %d CA tanks total", len(tanks_data))
+                return tanks_data
+            offset += _TANK_PAGE_SIZE
+
+    async def _fetch_tank_page(
+        self, offset: int
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Fetch one page of tanks, retrying transient failures."""
+        payload = {
+            "limit": str(_TANK_PAGE_SIZE),
+            "offset": str(offset),
+            "firstRun": "true" if offset == 0 else "false",
+            "listIndex": str(offset + 1),
+        }
 
-                    async with asyncio.timeout(60):
-                        response = await self._session.post(
-                            _TANK_DATA_URL,
-                            headers=api_headers,
-                            data=payload,
-                        )
+        retries = self._region_config.max_api_retries
+        for attempt in range(1, retries + 1):
+            try:
+                # A retry after a 403 picks up a token rotated meanwhile
+                payload["csrf_superior_token"] = await self._get_csrf_token()
+                async with asyncio.timeout(self._region_config.data_request_timeout):
+                    response = await self._session.post(
+                        _TANK_DATA_URL,
+                        headers=self._api_headers,
+                        data=payload,
+                    )
 
-                        if response.status != HTTP_OK:
-                            msg = f"Failed to get tank data: {response.status}"
-                            raise SuperiorPlusPropaneApiClientCommunicationError(msg)  # noqa: TRY301
-
-                        data_html = await response.text()
-                        response_json = json.loads(data_html)
-                        tank_list = json.loads(response_json.get("data", "[]"))
-
-                        if not response_json.get("status"):
-                            if tanks_data and not tank_list:
-                                LOGGER.debug(
-                                    "API returned status=false with empty list"
-                                    " — all tanks retrieved"
-                                )
-                                finished = True
-                                break
-                            msg = (
-                                "Tank API error: "
-                                f"{response_json.get('message', 'Unknown')}"
-                            )
-                            raise SuperiorPlusPropaneApiClientError(msg)
+                    if response.status != HTTP_OK:
+                        msg = f"Failed to get tank data: {response.status}"
+                        raise SuperiorPlusPropaneApiClientCommunicationError(msg)  # noqa: TRY301
 
-                        if not tank_list:
-                            LOGGER.debug("Empty tank list — all retrieved")
-                            finished = True
-                            break
+                    raw = await response.read()
 
-                        tanks_in_batch = 0
-                        for idx, tank in enumerate(tank_list, offset + 1):
-                            tank_data = self._parse_tank_json(tank, idx)
-                            if tank_data:
-                                tanks_data.append(tank_data)
-                                tanks_in_batch += 1
+                # orjson decodes the bytes directly, with no str copy
+                response_json = orjson.loads(raw)
+                if not isinstance(response_json, dict):
+                    msg = "Unexpected tank data response"
+                    raise SuperiorPlusPropaneApiClientCommunicationError(msg)  # noqa: TRY301
 
-                        finished = response_json.get("finished", True)
+                # The tank list is JSON encoded a second time inside "data"
+                tank_list = orjson.loads(response_json.get("data", "[]"))
 
-                        if tanks_in_batch < _TANK_PAGE_SIZE:
-                            finished = True
+            except orjson.JSONDecodeError as exc:
+                LOGGER.debug(
+                    "JSON parse error (attempt %d): %s",
+                    attempt,
+                    exc,
+                )
+                if attempt == retries:
+                    msg = "Failed to get valid JSON after retries"
+                    raise SuperiorPlusPropaneApiClientError(msg) from exc
+
+            except (
+                TimeoutError,
+                SuperiorPlusPropaneApiClientCommunicationError,
+            ) as exc:
+                LOGGER.debug(
+                    "Error getting tanks (attempt %d): %s",
+                    attempt,
+                    exc,
+                )
+                if attempt == retries:
+                    msg = "Tank API timeout after retries"
+                    raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
 
-                        offset += _TANK_PAGE_SIZE
-                        break
+            else:
+                return response_json, tank_list
 
-                except json.JSONDecodeError as exc:
-                    LOGGER.debug(
-                        "JSON parse error (attempt %d): %s",
-                        attempt,
-                        exc,
-                    )
-                    if attempt == retries:
-                        if tanks_data:
-                            LOGGER.warning(
-                                "JSON error but returning %d tanks collected",
-                                len(tanks_data),
-                            )
-                            return tanks_data
-                        msg = "Failed to get valid JSON after retries"
-                        raise SuperiorPlusPropaneApiClientError(msg) from exc
-                    await asyncio.sleep(
-                        self._region_config.retry_delay_seconds + (attempt * 10)
-                    )
+            await asyncio.sleep(self._data_backoff_delay(attempt))
 
-                except (
-                    TimeoutError,
-                    SuperiorPlusPropaneApiClientCommunicationError,
-                ) as exc:
-                    LOGGER.debug(
-                        "Error getting tanks (attempt %d): %s",
-                        attempt,
-                        exc,
-                    )
-                    if attempt == retries:
-                        if tanks_data:
-                            LOGGER.warning(
-                                "API error but returning %d tanks collected",
-                                len(tanks_data),
-                            )
-                            return tanks_data
-                        msg = "Tank API timeout after retries"
-                        raise SuperiorPlusPropaneApiClientCommunicationError(
-                            msg
-                        ) from exc
-                    await asyncio.sleep(
-                        self._region_config.retry_delay_seconds + (attempt * 10)
-                    )
+        msg = "Tank API timeout after retries"
+        raise SuperiorPlusPropaneApiClientCommunicationError(msg)
 
-                except SuperiorPlusPropaneApiClientAuthenticationError:
-                    raise
+    def _collect_tank_page(
+        self,
+        page: tuple[dict[str, Any], list[dict[str, Any]]],
+        offset: int,
+        tanks_data: list[dict[str, Any]],
+    ) -> bool:
+        """Add one page of tanks to tanks_data; return True on the last page."""
+        response_json, tank_list = page
+
+        if not response_json.get("status"):
+            if tanks_data and not tank_list:
+                LOGGER.debug(
+                    "API returned status=false with empty list — all tanks retrieved"
+                )
+                return True
+            msg = f"Tank API error: {response_json.get('message', 'Unknown')}"
+            raise SuperiorPlusPropaneApiClientError(msg)
+
+        if not tank_list:
+            LOGGER.debug("Empty tank list — all retrieved")
+            return True
+
+        tanks_data.extend(
+            tank_data
+            for tank_data in (
+                self._parse_tank_json(tank, idx)
+                for idx, tank in enumerate(tank_list, offset + 1)
+            )
+            if tank_data
+        )
 
-        LOGGER.debug("Parsed %d CA tanks total", len(tanks_data))
-        return tanks_data
+        # The server's flag decides; a short page means it was the last one
+        finished = response_json.get("finished", True)
+        return bool(finished) or len(tank_list) < _TANK_PAGE_SIZE
 
     async def _get_orders_totals(self) -> dict[str, Any]:
         """Get orders history and compute totals from HTML response."""
@@ -397,19 +509,10 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                     "firstRun": "true",
                 }
 
-                api_headers = self._headers.copy()
-                api_headers.update(
-                    {
-                        "content-type": "application/x-www-form-urlencoded",
-                        "referer": _DASHBOARD_URL,
-                        "x-requested-with": "XMLHttpRequest",
-                    }
-                )
-
-                async with asyncio.timeout(60):
+                async with asyncio.timeout(self._region_config.data_request_timeout):
                     response = await self._session.post(
                         _ORDERS_URL,
-                        headers=api_headers,
+                        headers=self._api_headers,
                         data=payload,
                     )
 
@@ -418,39 +521,33 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                         raise SuperiorPlusPropaneApiClientCommunicationError(msg)  # noqa: TRY301
 
                     data_html = await response.text()
-                    soup = BeautifulSoup(data_html, "html.parser")
-                    rows = soup.find_all("div", class_="orders__row cf")
-
-                    for row in rows:
-                        cols = row.find_all("div")
-                        if len(cols) == _ORDER_COLUMN_COUNT:
-                            product = cols[2].text.strip().upper()
-                            if "PROPANE" in product:
-                                try:
-                                    amount_str = (
-                                        cols[3].text.strip().split()[0].replace(",", "")
-                                    )
-                                    price_str = (
-                                        cols[4]
-                                        .text.strip()
-                                        .lstrip("$")
-                                        .replace(",", "")
-                                    )
-                                    litres = int(float(amount_str))
-                                    cost = round(float(price_str), 2)
-                                    orders_totals["total_volume"] += litres
-                                    orders_totals["total_cost"] = round(
-                                        orders_totals["total_cost"] + cost, 2
-                                    )
-                                except ValueError as exc:
-                                    LOGGER.warning(
-                                        "Invalid order data: %s | Error: %s",
-                                        row.text.strip(),
-                                        exc,
-                                    )
-
-                    total_vol = orders_totals["total_volume"]
-                    total_cost = orders_totals["total_cost"]
+                    if "propane" not in data_html.casefold():
+                        LOGGER.debug("No propane orders in CA order history")
+                        return orders_totals
+
+                    total_vol = 0
+                    total_cents = 0
+                    for cols in _order_rows(data_html):
+                        if "PROPANE" not in cols[2].upper():
+                            continue
+                        try:
+                            amount_str = cols[3].split()[0].translate(_NUM_TBL)
+                            price_str = cols[4].translate(_NUM_TBL)
+                            litres = int(float(amount_str))
+                            cents = round(float(price_str) * 100)
+                            total_vol += litres
+                            total_cents += cents
+                        except ValueError as exc:
+                            LOGGER.warning(
+                                "Invalid order data: %s | Error: %s",
+                                " ".join(col.strip() for col in cols),
+                                exc,
+                            )
+
+                    # Whole cents keep the running total exact
+                    total_cost = total_cents / 100
+                    orders_totals["total_volume"] = total_vol
+                    orders_totals["total_cost"] = total_cost
                     if total_vol > 0:
                         orders_totals["average_price"] = round(
                             total_cost / total_vol, 4
@@ -471,9 +568,7 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
                 if attempt == retries:
                     msg = "Failed to get orders after retries"
                     raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
-                await asyncio.sleep(
-                    self._region_config.retry_delay_seconds + (attempt * 10)
-                )
+                await asyncio.sleep(self._data_backoff_delay(attempt))
 
             except SuperiorPlusPropaneApiClientAuthenticationError:
                 raise
@@ -486,23 +581,22 @@ class SuperiorPropaneCAApiClient(SuperiorPropaneApiBase):
     ) -> dict[str, Any] | None:
         """Parse a single CA tank from JSON into normalized common format."""
         try:
-            last_fill = tank.get("adds_last_fill", "unknown")
-            if last_fill != "unknown" and " " in last_fill:
-                last_fill = last_fill.split(" ")[0]
+            # Drop the time from "YYYY-MM-DD HH:MM:SS"
+            last_fill = tank.get("adds_last_fill", "unknown").partition(" ")[0]
 
             return {
                 # Common normalized fields
-                "tank_id": str(tank.get("adds_tank_id", "unknown")),
+                **{
+                    key: _as_str(tank.get(portal_key), default)
+                    for key, portal_key, default in _STR_FIELDS
+                },
                 "tank_number": tank_number,
                 "address": tank.get("adds_location", "Unknown"),
                 "tank_name": tank.get("tank_name", "Unknown"),
-                "tank_size": str(tank.get("adds_tank_size", "unknown")),
                 "tank_type": "Propane",
-                "serial_number": str(tank.get("adds_serial_number", "unknown")).strip(),
-                "customer_number": str(tank.get("adds_customer_number", "unknown")),
-                "level": str(tank.get("adds_fill_percentage", "unknown")),
-                "current_volume": str(tank.get("adds_fill", "unknown")),
-                "reading_date": str(tank.get("adds_last_reading", "unknown")),
+                "serial_number": _as_str(
+                    tank.get("adds_serial_number"), "unknown"
+                ).strip(),
                 "last_delivery": last_fill,
                 "price_per_unit": "unknown",
                 "is_on_delivery_plan": tank.get("isOnDeliveryPlan") == "1",
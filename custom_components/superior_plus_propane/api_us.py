@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import re
-from datetime import datetime
+from datetime import date
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
+from lxml import etree
+from lxml import html as lxml_html
 from slugify import slugify
 
 from .api import (
+    HTTP_NOT_MODIFIED,
     HTTP_OK,
     SESSION_EXPIRED_MSG,
     SuperiorPlusPropaneApiClientAuthenticationError,
@@ -22,7 +28,9 @@ from .api import (
 from .const import LOGGER
 
 if TYPE_CHECKING:
-    import aiohttp
+    from collections.abc import Mapping
+
+    from lxml.html import HtmlElement
 
     from .region import RegionConfig
 
@@ -32,11 +40,119 @@ _LOGIN_URL = "https://mysuperioraccountlogin.com/Account/Login?ReturnUrl=%2F"
 _HOME_URL = "https://mysuperioraccountlogin.com/"
 _CUSTOMERS_URL = "https://mysuperioraccountlogin.com/Customers"
 _TANK_URL = "https://mysuperioraccountlogin.com/Tank"
+_LOGIN_PATH = "/Account/Login"
+
+# Request timeouts, applied by aiohttp to the whole request including the body
+_LOGIN_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_NAVIGATION_TIMEOUT = aiohttp.ClientTimeout(total=60)
+_DATA_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Browser headers shared by every request, identical for every client
+_STATIC_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "accept": (
+            "text/html,application/xhtml+xml,application/xml;q=0.9,"
+            "image/avif,image/webp,image/apng,*/*;q=0.8,"
+            "application/signed-exchange;v=b3;q=0.7"
+        ),
+        "accept-language": "en-US,en;q=0.9",
+        "cache-control": "max-age=0",
+        "content-type": "application/x-www-form-urlencoded",
+        "origin": "https://mysuperioraccountlogin.com",
+        "referer": _LOGIN_PAGE_URL,
+        "sec-ch-ua": (
+            '"Google Chrome";v="125", "Chromium";v="125", "Not.A/Brand";v="24"'
+        ),
+        "sec-ch-ua-mobile": "?0",
+        "sec-ch-ua-platform": '"macOS"',
+        "sec-fetch-dest": "document",
+        "sec-fetch-mode": "navigate",
+        "sec-fetch-site": "same-origin",
+        "sec-fetch-user": "?1",
+        "upgrade-insecure-requests": "1",
+        "user-agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/125.0.0.0 Safari/537.36"
+        ),
+    }
+)
+
+# Value reported for any tank field the page does not provide
+_UNKNOWN = "unknown"
+
+# Login form field carrying the anti-forgery token
+_CSRF_FIELD = "__RequestVerificationToken"
+
+# Anti-forgery input as ASP.NET renders it; other markup falls back to bs4
+_RE_CSRF_INPUT = re.compile(
+    rf'<input\b[^>]*\bname="{_CSRF_FIELD}"[^>]*\bvalue="([^"&]+)"'
+)
+
+
+# The portal serves UTF-8; parse the raw bytes without a Python decode
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def _class_xpath(tag: str, css_class: str) -> str:
+    """Build an XPath step matching a single CSS class token."""
+    return (
+        f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+    )
+
+
+# Tank page selectors, compiled once so row parsing stays inside libxml2
+_XP_LOGIN_FORM = etree.XPath(f"//form[@action='{_LOGIN_PATH}']")
+_XP_TANK_ROWS = etree.XPath(f"//{_class_xpath('div', 'tank-row')}")
+_XP_ADDRESS = etree.XPath(f"(.//{_class_xpath('*', 'col-md-2')})[1]")
+_XP_TANK_INFO = etree.XPath(f"(.//{_class_xpath('*', 'col-md-3')})[1]")
+_XP_PROGRESS_BAR = etree.XPath(f"(.//{_class_xpath('div', 'progress-bar')})[1]")
+_XP_TEXT = etree.XPath(".//text()", smart_strings=False)
+
+# Tank row text patterns, compiled once instead of per row
+_RE_TANK_SIZE = re.compile(r"(\d+)\s*gal\.")
+# The row fields below have distinct literal prefixes, so one alternation
+# finds the first occurrence of each in a single scan of the row text
+_RE_ROW_FIELDS = re.compile(
+    r"Approximately (?P<gallons>\d+) gallons in tank"
+    r"|Reading Date:\s*(?P<reading_date>\d{1,2}/\d{1,2}/\d{4})"
+    r"|Last Delivery:\s*(?P<last_delivery>\d{1,2}/\d{1,2}/\d{4})"
+    r"|\$(?P<price>\d+\.\d+)"
+)
+_ROW_FIELD_COUNT = _RE_ROW_FIELDS.groups
+_RE_US_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_RE_DIGIT_COMMA = re.compile(r"(?<=\d),(?=\d)")
+_RE_SLUG_DISALLOWED = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_date(date_str: str) -> str:
+    """Normalize US date format M/D/YYYY to ISO 8601 YYYY-MM-DD."""
+    match = _RE_US_DATE.fullmatch(date_str)
+    if not match:
+        return date_str
+    month, day, year = map(int, match.groups())
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return date_str
+
+
+def _make_tank_id(address: str) -> str:
+    """Build the tank ID slug for an address."""
+    # Plain ASCII addresses slug to the same value python-slugify produces;
+    # anything it would transliterate or entity-decode goes through it.
+    if address.isascii() and "&" not in address:
+        lowered = _RE_DIGIT_COMMA.sub("", address.lower())
+        return _RE_SLUG_DISALLOWED.sub("-", lowered).strip("-")
+    return slugify(address.lower())
 
 
 class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
     """US Superior Plus Propane API Client — HTML scraping."""
 
+    SESSION_HEADERS = _STATIC_HEADERS
+
     def __init__(
         self,
         username: str,
@@ -46,33 +162,17 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
     ) -> None:
         """Initialize the US API client."""
         super().__init__(username, password, session, region_config)
-        self._headers = {
-            "accept": (
-                "text/html,application/xhtml+xml,application/xml;q=0.9,"
-                "image/avif,image/webp,image/apng,*/*;q=0.8,"
-                "application/signed-exchange;v=b3;q=0.7"
-            ),
-            "accept-language": "en-US,en;q=0.9",
-            "cache-control": "max-age=0",
-            "content-type": "application/x-www-form-urlencoded",
-            "origin": "https://mysuperioraccountlogin.com",
-            "referer": _LOGIN_PAGE_URL,
-            "sec-ch-ua": (
-                '"Google Chrome";v="125", "Chromium";v="125", "Not.A/Brand";v="24"'
-            ),
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"macOS"',
-            "sec-fetch-dest": "document",
-            "sec-fetch-mode": "navigate",
-            "sec-fetch-site": "same-origin",
-            "sec-fetch-user": "?1",
-            "upgrade-insecure-requests": "1",
-            "user-agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/125.0.0.0 Safari/537.36"
-            ),
+        self._headers = self._without_session_headers(_STATIC_HEADERS)
+        # Only the CSRF token changes between logins
+        self._login_fields = {
+            "EmailAddress": username,
+            "Password": password,
+            "RememberMe": "true",
         }
+        # Validators from the last tank page, sent back as a conditional GET
+        self._last_etag: str | None = None
+        self._last_modified: str | None = None
+        self._cached_tanks: list[dict[str, Any]] | None = None
 
     async def async_get_tanks_data(self) -> list[dict[str, Any]]:
         """Get tank data from Superior Plus Propane US portal."""
@@ -92,30 +192,18 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
             raise SuperiorPlusPropaneApiClientError(msg) from exc
 
     async def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid authenticated session."""
+        """Ensure we have an authenticated session."""
+        # Expiry is detected lazily: the tank page redirects to the login
+        # form and async_get_tanks_data re-authenticates and retries.
         if self._authenticated:
-            try:
-                async with asyncio.timeout(10):
-                    response = await self._session.get(_HOME_URL, headers=self._headers)
-                    if response.status == HTTP_OK and "Login" not in str(response.url):
-                        LOGGER.debug("Session still valid")
-                        return
-                    LOGGER.debug("Session invalid, need to re-authenticate")
-                    self._authenticated = False
-            except (TimeoutError, Exception) as exc:
-                LOGGER.debug("Session validation failed: %s", exc)
-                self._authenticated = False
-                self._session.cookie_jar.clear()
-
-        if not self._authenticated and not self._auth_in_progress:
-            await self._authenticate()
+            return
+        async with self._auth_lock:
+            # Another caller may have logged in while we waited
+            if not self._authenticated:
+                await self._authenticate()
 
     async def _authenticate(self) -> None:
         """Perform full authentication sequence."""
-        if self._auth_in_progress:
-            return
-
-        self._auth_in_progress = True
         try:
             LOGGER.debug("Starting US authentication sequence")
             self._session.cookie_jar.clear()
@@ -128,42 +216,47 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
         except Exception:
             self._authenticated = False
             raise
-        finally:
-            self._auth_in_progress = False
 
     async def _get_csrf_token(self) -> str:
         """Get CSRF token from login page hidden input."""
         try:
-            async with asyncio.timeout(30):
-                response = await self._session.get(
-                    _LOGIN_PAGE_URL, headers=self._headers
-                )
+            async with self._session.get(
+                _LOGIN_PAGE_URL, headers=self._headers, timeout=_LOGIN_TIMEOUT
+            ) as response:
                 if response.status != HTTP_OK:
                     msg = f"Failed to get login page: {response.status}"
                     raise SuperiorPlusPropaneApiClientCommunicationError(msg)
 
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
+                # The portal serves UTF-8; decoding directly skips charset sniffing
+                html = (await response.read()).decode("utf-8", errors="replace")
 
-                csrf_element = soup.find(
-                    "input", {"name": "__RequestVerificationToken"}
-                )
-                if not csrf_element or not isinstance(csrf_element, Tag):
-                    msg = "CSRF token not found"
-                    raise SuperiorPlusPropaneApiClientError(msg)
+            csrf_match = _RE_CSRF_INPUT.search(html)
+            if csrf_match:
+                return csrf_match.group(1)
 
-                csrf_value = csrf_element.get("value")
+            soup = BeautifulSoup(
+                html,
+                "lxml",
+                parse_only=SoupStrainer("input", {"name": _CSRF_FIELD}),
+            )
+
+            csrf_element = soup.find("input", {"name": _CSRF_FIELD})
+            if not csrf_element or not isinstance(csrf_element, Tag):
+                msg = "CSRF token not found"
+                raise SuperiorPlusPropaneApiClientError(msg)
+
+            csrf_value = csrf_element.get("value")
+            if not csrf_value:
+                msg = "CSRF token value not found"
+                raise SuperiorPlusPropaneApiClientError(msg)
+
+            if isinstance(csrf_value, list):
+                csrf_value = csrf_value[0] if csrf_value else None
                 if not csrf_value:
                     msg = "CSRF token value not found"
                     raise SuperiorPlusPropaneApiClientError(msg)
 
-                if isinstance(csrf_value, list):
-                    csrf_value = csrf_value[0] if csrf_value else None
-                    if not csrf_value:
-                        msg = "CSRF token value not found"
-                        raise SuperiorPlusPropaneApiClientError(msg)
-
-                return str(csrf_value)
+            return str(csrf_value)
 
         except TimeoutError as exc:
             msg = f"Timeout getting CSRF token: {exc}"
@@ -171,79 +264,116 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
 
     async def _login(self, csrf_token: str) -> None:
         """Login to Superior Plus Propane US portal."""
-        payload = {
-            "__RequestVerificationToken": csrf_token,
-            "EmailAddress": self._username,
-            "Password": self._password,
-            "RememberMe": "true",
-        }
+        payload = {_CSRF_FIELD: csrf_token, **self._login_fields}
 
         try:
-            async with asyncio.timeout(30):
-                response = await self._session.post(
-                    _LOGIN_URL, headers=self._headers, data=payload
-                )
-                if "Login" in str(response.url) or response.status != HTTP_OK:
+            async with self._session.post(
+                _LOGIN_URL,
+                headers=self._headers,
+                data=payload,
+                timeout=_LOGIN_TIMEOUT,
+            ) as response:
+                if (
+                    response.url.path.startswith(_LOGIN_PATH)
+                    or response.status != HTTP_OK
+                ):
                     msg = "Login failed - invalid credentials"
                     raise SuperiorPlusPropaneApiClientAuthenticationError(msg)
+                await response.read()
 
             LOGGER.debug("Login successful, navigating to required pages...")
 
-            async with asyncio.timeout(60):
-                await self._session.get(_HOME_URL, headers=self._headers)
-                await self._session.get(_CUSTOMERS_URL, headers=self._headers)
+            # In order: /Customers may rely on cookies the home page sets
+            await self._visit_page(_HOME_URL)
+            await self._visit_page(_CUSTOMERS_URL)
 
         except TimeoutError as exc:
             msg = f"Timeout during login: {exc}"
             raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
 
+    async def _visit_page(self, url: str) -> None:
+        """Load a page for its cookies and return the connection to the pool."""
+        async with self._session.get(
+            url, headers=self._headers, timeout=_NAVIGATION_TIMEOUT
+        ) as response:
+            # Draining the body lets the connection be reused
+            await response.read()
+
     async def _get_tanks_from_page(self) -> list[dict[str, Any]]:
         """Get tank data from the tank page."""
-        try:
-            async with asyncio.timeout(10):
-                response = await self._session.get(_TANK_URL, headers=self._headers)
+        headers = self._headers
+        if self._cached_tanks:
+            conditional = {}
+            if self._last_etag:
+                conditional["if-none-match"] = self._last_etag
+            if self._last_modified:
+                conditional["if-modified-since"] = self._last_modified
+            if conditional:
+                headers = {**headers, **conditional}
 
-                if "Login" in str(response.url):
+        try:
+            async with self._session.get(
+                _TANK_URL, headers=headers, timeout=_DATA_TIMEOUT
+            ) as response:
+                if response.url.path.startswith(_LOGIN_PATH):
                     LOGGER.debug("Redirected to login page, session expired")
                     self._authenticated = False
                     raise SuperiorPlusPropaneApiClientAuthenticationError(
                         SESSION_EXPIRED_MSG
                     )
 
+                if response.status == HTTP_NOT_MODIFIED and self._cached_tanks:
+                    LOGGER.debug("Tank page not modified, reusing cached tanks")
+                    return [dict(tank) for tank in self._cached_tanks]
+
                 if response.status != HTTP_OK:
                     msg = f"Failed to get tank page: {response.status}"
                     raise SuperiorPlusPropaneApiClientCommunicationError(msg)
 
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
+                raw = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
 
-                login_form = soup.find("form", {"action": "/Account/Login"})
-                if login_form:
-                    LOGGER.debug("Login form found on tank page")
-                    self._authenticated = False
-                    raise SuperiorPlusPropaneApiClientAuthenticationError(
-                        SESSION_EXPIRED_MSG
-                    )
+        except TimeoutError as exc:
+            msg = f"Timeout getting tank data: {exc}"
+            raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
 
-                tank_rows = soup.select("div.tank-row")
-                tanks_data = []
+        # Parsing is CPU bound; keep it off the event loop
+        tanks_data = await asyncio.get_running_loop().run_in_executor(
+            None, self._parse_tank_page, raw
+        )
+        if tanks_data is None:
+            LOGGER.debug("Login form found on tank page")
+            self._authenticated = False
+            raise SuperiorPlusPropaneApiClientAuthenticationError(SESSION_EXPIRED_MSG)
 
-                for idx, row in enumerate(tank_rows):
-                    tank_data = self._parse_tank_row(row, idx + 1)
-                    if tank_data:
-                        tanks_data.append(tank_data)
+        if not tanks_data:
+            msg = "No tanks found"
+            raise SuperiorPlusPropaneApiClientError(msg)
 
-                if not tanks_data:
-                    msg = "No tanks found"
-                    raise SuperiorPlusPropaneApiClientError(msg)
+        self._last_etag = etag
+        self._last_modified = last_modified
+        self._cached_tanks = [dict(tank) for tank in tanks_data]
+        return tanks_data
 
-                return tanks_data
+    def _parse_tank_page(self, raw: bytes) -> list[dict[str, Any]] | None:
+        """Parse all tank rows, or return None if the login form is shown."""
+        root = lxml_html.fromstring(raw, parser=_UTF8_HTML_PARSER)
 
-        except TimeoutError as exc:
-            msg = f"Timeout getting tank data: {exc}"
-            raise SuperiorPlusPropaneApiClientCommunicationError(msg) from exc
+        if _XP_LOGIN_FORM(root):
+            return None
+
+        tanks_data = []
+        for idx, row in enumerate(_XP_TANK_ROWS(root)):
+            tank_data = self._parse_tank_row(row, idx + 1)
+            if tank_data:
+                tanks_data.append(tank_data)
+
+        return tanks_data
 
-    def _parse_tank_row(self, row: Tag, tank_number: int) -> dict[str, Any] | None:
+    def _parse_tank_row(
+        self, row: HtmlElement, tank_number: int
+    ) -> dict[str, Any] | None:
         """Parse a single tank row into normalized common format."""
         try:
             address_info = self._extract_address(row)
@@ -253,14 +383,13 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
 
             tank_size, tank_type = self._extract_tank_info(row)
             level = self._extract_level(row)
-            current_gallons = self._extract_gallons(row)
-            reading_date = self._normalize_date(
-                self._extract_date(row, "Reading Date:")
-            )
-            last_delivery = self._normalize_date(
-                self._extract_date(row, "Last Delivery:")
-            )
-            price_per_gallon = self._extract_price(row)
+
+            # Single traversal, then a single regex scan for the text fields
+            fields = self._extract_row_fields(row.text_content())
+            current_gallons = fields.get("gallons", _UNKNOWN)
+            reading_date = _normalize_date(fields.get("reading_date", _UNKNOWN))
+            last_delivery = _normalize_date(fields.get("last_delivery", _UNKNOWN))
+            price_per_gallon = fields.get("price", _UNKNOWN)
 
         except (AttributeError, ValueError, TypeError) as exc:
             LOGGER.warning("Error parsing tank row %d: %s", tank_number, exc)
@@ -274,8 +403,8 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
                 "tank_name": address,
                 "tank_size": tank_size,
                 "tank_type": tank_type,
-                "serial_number": "unknown",
-                "customer_number": "unknown",
+                "serial_number": _UNKNOWN,
+                "customer_number": _UNKNOWN,
                 "level": level,
                 "current_volume": current_gallons,
                 "reading_date": reading_date,
@@ -284,38 +413,29 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
                 "is_on_delivery_plan": True,
             }
 
-    @staticmethod
-    def _normalize_date(date_str: str) -> str:
-        """Normalize US date format M/D/YYYY to ISO 8601 YYYY-MM-DD."""
-        if date_str == "unknown":
-            return "unknown"
-        try:
-            parsed = datetime.strptime(date_str, "%m/%d/%Y")  # noqa: DTZ007
-            return parsed.strftime("%Y-%m-%d")
-        except (ValueError, TypeError):
-            return date_str
-
-    def _extract_address(self, row: Tag) -> tuple[str, str] | None:
+    def _extract_address(self, row: HtmlElement) -> tuple[str, str] | None:
         """Extract and clean address from row."""
-        address_element = row.select_one(".col-md-2")
-        if not address_element:
+        address_elements = _XP_ADDRESS(row)
+        if not address_elements:
             return None
 
-        address_text = address_element.get_text(separator=" ", strip=True)
-        address = address_text.split("\n")[0] if "\n" in address_text else address_text
-        address = re.sub(r"\s+", " ", address).strip()
-        tank_id = slugify(address.lower().replace(" ", "_"))
+        # Equivalent of get_text(separator=" ", strip=True)
+        address_text = " ".join(
+            text.strip() for text in _XP_TEXT(address_elements[0]) if text.strip()
+        )
+        address = " ".join(address_text.partition("\n")[0].split())
+        tank_id = _make_tank_id(address)
         return address, tank_id
 
-    def _extract_tank_info(self, row: Tag) -> tuple[str, str]:
+    def _extract_tank_info(self, row: HtmlElement) -> tuple[str, str]:
         """Extract tank size and type."""
-        tank_info_element = row.select_one(".col-md-3")
-        tank_size = "unknown"
-        tank_type = "unknown"
+        tank_info_elements = _XP_TANK_INFO(row)
+        tank_size = _UNKNOWN
+        tank_type = _UNKNOWN
 
-        if tank_info_element:
-            tank_info_text = tank_info_element.get_text()
-            size_match = re.search(r"(\d+)\s*gal\.", tank_info_text)
+        if tank_info_elements:
+            tank_info_text = tank_info_elements[0].text_content()
+            size_match = _RE_TANK_SIZE.search(tank_info_text)
             if size_match:
                 tank_size = size_match.group(1)
             if "Propane" in tank_info_text:
@@ -323,44 +443,22 @@ class SuperiorPropaneUSApiClient(SuperiorPropaneApiBase):
 
         return tank_size, tank_type
 
-    def _extract_level(self, row: Tag) -> str:
+    def _extract_level(self, row: HtmlElement) -> str:
         """Extract level percentage from progress bar."""
-        progress_bar = row.select_one("div.progress-bar")
-        if progress_bar and progress_bar.get("aria-valuenow"):
-            value = progress_bar.get("aria-valuenow")
-            if isinstance(value, list):
-                return value[0] if value else "unknown"
-            return str(value) if value else "unknown"
-        return "unknown"
-
-    def _extract_gallons(self, row: Tag) -> str:
-        """Extract current gallons."""
-        gallons_text = row.find(string=re.compile(r"Approximately \d+ gallons in tank"))
-        if gallons_text:
-            gallons_match = re.search(
-                r"Approximately (\d+) gallons in tank", str(gallons_text)
-            )
-            if gallons_match:
-                return gallons_match.group(1)
-        return "unknown"
-
-    def _extract_date(self, row: Tag, pattern: str) -> str:
-        """Extract date by pattern."""
-        date_text = row.find(string=re.compile(pattern))
-        if date_text and date_text.parent:
-            full_text = date_text.parent.get_text()
-            date_match = re.search(
-                rf"{pattern}\s*(\d{{1,2}}/\d{{1,2}}/\d{{4}})", full_text
-            )
-            if date_match:
-                return date_match.group(1)
-        return "unknown"
-
-    def _extract_price(self, row: Tag) -> str:
-        """Extract price per gallon."""
-        price_text = row.find(string=re.compile(r"\$\d+\.\d+"))
-        if price_text:
-            price_match = re.search(r"\$(\d+\.\d+)", str(price_text))
-            if price_match:
-                return price_match.group(1)
-        return "unknown"
+        progress_bars = _XP_PROGRESS_BAR(row)
+        if progress_bars:
+            value = progress_bars[0].get("aria-valuenow")
+            return str(value) if value else _UNKNOWN
+        return _UNKNOWN
+
+    @staticmethod
+    def _extract_row_fields(row_text: str) -> dict[str, str]:
+        """Extract the first gallons, dates and price found in the row text."""
+        fields: dict[str, str] = {}
+        for match in _RE_ROW_FIELDS.finditer(row_text):
+            name = match.lastgroup
+            if name and name not in fields:
+                fields[name] = match[name]
+                if len(fields) == _ROW_FIELD_COUNT:
+                    break
+        return fields
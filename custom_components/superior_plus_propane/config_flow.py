@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from slugify import slugify
@@ -29,6 +31,84 @@ from .const import (
 )
 from .region import get_region_config
 
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .region import RegionConfig
+
+# Selectors and schemas with no per-render state, built once at import
+_REGION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_REGION, default="us"): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[
+                    selector.SelectOptionDict(value="us", label="United States"),
+                    selector.SelectOptionDict(value="ca", label="Canada"),
+                ],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+    }
+)
+_EMAIL_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.EMAIL),
+)
+_PASSWORD_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD),
+)
+_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=300,
+        max=86400,
+        step=300,
+        unit_of_measurement="seconds",
+        mode=selector.NumberSelectorMode.BOX,
+    ),
+)
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_REAUTH_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): _EMAIL_SELECTOR,
+        vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
+    }
+)
+
+
+@cache
+def _threshold_selectors(
+    volume_unit: str,
+) -> tuple[selector.NumberSelector, selector.NumberSelector]:
+    """Return the min and max threshold selectors for a volume unit."""
+    return (
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.01,
+                max=5.0,
+                step=0.01,
+                unit_of_measurement=volume_unit,
+                mode=selector.NumberSelectorMode.BOX,
+            ),
+        ),
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1.0,
+                max=100.0,
+                step=1.0,
+                unit_of_measurement=volume_unit,
+                mode=selector.NumberSelectorMode.BOX,
+            ),
+        ),
+    )
+
+
+def _thresholds_inverted(user_input: dict[str, Any]) -> bool:
+    """Return True if both thresholds are set and min is not below max."""
+    thresholds = (
+        user_input.get(CONF_MIN_THRESHOLD),
+        user_input.get(CONF_MAX_THRESHOLD),
+    )
+    return None not in thresholds and thresholds[0] >= thresholds[1]
+
 
 class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Superior Plus Propane."""
@@ -38,6 +118,17 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the flow."""
         self._region: str = "us"
+        self._region_config: RegionConfig = get_region_config(self._region)
+        # Reused by every credential check in this flow, so retries after a
+        # typo keep the warm connection instead of a new TCP+TLS handshake
+        self._session: aiohttp.ClientSession | None = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the credential check session when the flow ends."""
+        if self._session is not None:
+            self.hass.async_create_task(self._session.close())
+            self._session = None
 
     async def async_step_user(
         self,
@@ -46,39 +137,23 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Step 1: Region selection."""
         if user_input is not None:
             self._region = user_input.get(CONF_REGION, "us")
+            self._region_config = get_region_config(self._region)
             return await self.async_step_credentials()
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_REGION, default="us"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(
-                                    value="us", label="United States"
-                                ),
-                                selector.SelectOptionDict(value="ca", label="Canada"),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
-                }
-            ),
-        )
+        return self.async_show_form(step_id="user", data_schema=_REGION_SCHEMA)
 
     async def async_step_credentials(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> config_entries.ConfigFlowResult:
         """Step 2: Credentials and options."""
-        region_config = get_region_config(self._region)
+        region_config = self._region_config
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
                 await self._test_credentials(
-                    region=self._region,
+                    region_config=region_config,
                     username=user_input[CONF_USERNAME],
                     password=user_input[CONF_PASSWORD],
                 )
@@ -92,9 +167,7 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 LOGGER.exception(exc)
                 errors["base"] = "unknown"
             else:
-                min_val = user_input.get(CONF_MIN_THRESHOLD)
-                max_val = user_input.get(CONF_MAX_THRESHOLD)
-                if min_val is not None and max_val is not None and min_val >= max_val:
+                if _thresholds_inverted(user_input):
                     errors["base"] = "invalid_thresholds"
                 else:
                     await self.async_set_unique_id(slugify(user_input[CONF_USERNAME]))
@@ -133,7 +206,7 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                         },
                     )
 
-        volume_unit = region_config.volume_unit
+        min_selector, max_selector = _threshold_selectors(region_config.volume_unit)
 
         return self.async_show_form(
             step_id="credentials",
@@ -142,60 +215,28 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_USERNAME,
                         default=(user_input or {}).get(CONF_USERNAME, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.EMAIL,
-                        ),
-                    ),
-                    vol.Required(CONF_PASSWORD): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
-                    ),
+                    ): _EMAIL_SELECTOR,
+                    vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_UPDATE_INTERVAL,
                         default=region_config.default_update_interval,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=300,
-                            max=86400,
-                            step=300,
-                            unit_of_measurement="seconds",
-                            mode=selector.NumberSelectorMode.BOX,
-                        ),
-                    ),
+                    ): _INTERVAL_SELECTOR,
                     vol.Optional(
                         CONF_INCLUDE_UNMONITORED,
                         default=False,
-                    ): selector.BooleanSelector(),
+                    ): _BOOLEAN_SELECTOR,
                     vol.Optional(
                         CONF_ADAPTIVE_THRESHOLDS,
                         default=True,
-                    ): selector.BooleanSelector(),
+                    ): _BOOLEAN_SELECTOR,
                     vol.Optional(
                         CONF_MIN_THRESHOLD,
                         default=region_config.default_min_threshold,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0.01,
-                            max=5.0,
-                            step=0.01,
-                            unit_of_measurement=volume_unit,
-                            mode=selector.NumberSelectorMode.BOX,
-                        ),
-                    ),
+                    ): min_selector,
                     vol.Optional(
                         CONF_MAX_THRESHOLD,
                         default=region_config.default_max_threshold,
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1.0,
-                            max=100.0,
-                            step=1.0,
-                            unit_of_measurement=volume_unit,
-                            mode=selector.NumberSelectorMode.BOX,
-                        ),
-                    ),
+                    ): max_selector,
                 },
             ),
             errors=errors,
@@ -220,7 +261,7 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             region = reauth_entry.data.get(CONF_REGION, "us")
             try:
                 await self._test_credentials(
-                    region=region,
+                    region_config=get_region_config(region),
                     username=user_input[CONF_USERNAME],
                     password=user_input[CONF_PASSWORD],
                 )
@@ -243,41 +284,27 @@ class SuperiorPlusPropaneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_USERNAME): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.EMAIL,
-                        ),
-                    ),
-                    vol.Required(CONF_PASSWORD): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
-                    ),
-                }
-            ),
+            data_schema=_REAUTH_SCHEMA,
             errors=errors,
         )
 
     async def _test_credentials(
-        self, region: str, username: str, password: str
+        self, region_config: RegionConfig, username: str, password: str
     ) -> None:
         """Validate credentials using the appropriate API client."""
-        region_config = get_region_config(region)
+        if self._session is None:
+            # A private session, since the clients clear its cookie jar
+            self._session = async_create_clientsession(self.hass)
         client = create_api_client(
-            region=region,
+            region=region_config.region,
             username=username,
             password=password,
-            session=async_create_clientsession(self.hass),
+            session=self._session,
             region_config=region_config,
         )
-        try:
-            if not await client.async_test_connection():
-                msg = "Connection test failed"
-                raise SuperiorPlusPropaneApiClientAuthenticationError(msg)
-        finally:
-            await client.async_close()
+        if not await client.async_test_connection():
+            msg = "Connection test failed"
+            raise SuperiorPlusPropaneApiClientAuthenticationError(msg)
 
     @staticmethod
     def async_get_options_flow(
@@ -296,21 +323,14 @@ class SuperiorPlusPropaneOptionsFlowHandler(config_entries.OptionsFlow):
     ) -> config_entries.ConfigFlowResult:
         """Manage the options."""
         if user_input is not None:
-            min_threshold = user_input.get(CONF_MIN_THRESHOLD)
-            max_threshold = user_input.get(CONF_MAX_THRESHOLD)
-            if (
-                min_threshold is not None
-                and max_threshold is not None
-                and min_threshold >= max_threshold
-            ):
+            if _thresholds_inverted(user_input):
                 return self.async_show_form(
                     step_id="init",
                     data_schema=self._get_options_schema(),
                     errors={"base": "invalid_thresholds"},
                 )
 
-            data = dict(self.config_entry.data)
-            data.update(user_input)
+            data = {**self.config_entry.data, **user_input}
             self.hass.config_entries.async_update_entry(self.config_entry, data=data)
             return self.async_create_entry(title="", data={})
 
@@ -321,47 +341,33 @@ class SuperiorPlusPropaneOptionsFlowHandler(config_entries.OptionsFlow):
 
     def _get_options_schema(self) -> vol.Schema:
         """Get the options schema with current values."""
-        region = self.config_entry.data.get(CONF_REGION, "us")
-        region_config = get_region_config(region)
-        volume_unit = region_config.volume_unit
+        data = self.config_entry.data
+        region_config = get_region_config(data.get(CONF_REGION, "us"))
+        min_selector, max_selector = _threshold_selectors(region_config.volume_unit)
 
-        current_interval = self.config_entry.data.get(
+        current_interval = data.get(
             CONF_UPDATE_INTERVAL, region_config.default_update_interval
         )
-        current_adaptive = self.config_entry.data.get(CONF_ADAPTIVE_THRESHOLDS, True)
-        current_include_unmonitored = self.config_entry.data.get(
-            CONF_INCLUDE_UNMONITORED, False
-        )
-        current_min = self.config_entry.data.get(
-            CONF_MIN_THRESHOLD, region_config.default_min_threshold
-        )
-        current_max = self.config_entry.data.get(
-            CONF_MAX_THRESHOLD, region_config.default_max_threshold
-        )
+        current_adaptive = data.get(CONF_ADAPTIVE_THRESHOLDS, True)
+        current_include_unmonitored = data.get(CONF_INCLUDE_UNMONITORED, False)
+        current_min = data.get(CONF_MIN_THRESHOLD, region_config.default_min_threshold)
+        current_max = data.get(CONF_MAX_THRESHOLD, region_config.default_max_threshold)
 
         return vol.Schema(
             {
                 vol.Optional(
                     CONF_UPDATE_INTERVAL,
                     default=current_interval,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=300,
-                        max=86400,
-                        step=300,
-                        unit_of_measurement="seconds",
-                        mode=selector.NumberSelectorMode.BOX,
-                    ),
-                ),
+                ): _INTERVAL_SELECTOR,
                 vol.Optional(
                     CONF_INCLUDE_UNMONITORED,
                     default=current_include_unmonitored,
-                ): selector.BooleanSelector(),
+                ): _BOOLEAN_SELECTOR,
                 vol.Optional(
                     CONF_ADAPTIVE_THRESHOLDS,
                     default=current_adaptive,
                     description={"suggested_value": current_adaptive},
-                ): selector.BooleanSelector(),
+                ): _BOOLEAN_SELECTOR,
                 vol.Optional(
                     CONF_MIN_THRESHOLD,
                     default=current_min,
@@ -369,15 +375,7 @@ class SuperiorPlusPropaneOptionsFlowHandler(config_entries.OptionsFlow):
                         "suggested_value": current_min,
                         "suffix": ("Only used when adaptive thresholds are disabled"),
                     },
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=0.01,
-                        max=5.0,
-                        step=0.01,
-                        unit_of_measurement=volume_unit,
-                        mode=selector.NumberSelectorMode.BOX,
-                    ),
-                ),
+                ): min_selector,
                 vol.Optional(
                     CONF_MAX_THRESHOLD,
                     default=current_max,
@@ -385,14 +383,6 @@ class SuperiorPlusPropaneOptionsFlowHandler(config_entries.OptionsFlow):
                         "suggested_value": current_max,
                         "suffix": ("Only used when adaptive thresholds are disabled"),
                     },
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1.0,
-                        max=100.0,
-                        step=1.0,
-                        unit_of_measurement=volume_unit,
-                        mode=selector.NumberSelectorMode.BOX,
-                    ),
-                ),
+                ): max_selector,
             }
         )
@@ -33,3 +33,4 @@ PERCENT_MULTIPLIER = 100.0
 
 # Staleness limit for returning stale data on communication errors
 MAX_STALE_DATA_HOURS = 4
+MAX_STALE_DATA_SECONDS = MAX_STALE_DATA_HOURS * SECONDS_PER_HOUR
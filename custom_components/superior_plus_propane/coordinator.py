@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -18,7 +21,7 @@ from .const import (
     DATA_VALIDATION_TOLERANCE,
     LOGGER,
     MAX_CONSUMPTION_PERCENTAGE,
-    MAX_STALE_DATA_HOURS,
+    MAX_STALE_DATA_SECONDS,
     MIN_CONSUMPTION_PERCENTAGE,
     PERCENT_MULTIPLIER,
     SECONDS_PER_HOUR,
@@ -26,14 +29,29 @@ from .const import (
 
 STORAGE_VERSION = 1
 STORAGE_KEY = "superior_plus_propane_consumption"
+# Seconds to coalesce consumption writes into a single save
+SAVE_DELAY = 10
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
 
     from .data import SuperiorPlusPropaneConfigEntry
     from .region import RegionConfig
 
 
+@dataclass(slots=True)
+class TankState:
+    """Per-tank consumption tracking state kept across refreshes."""
+
+    previous_volume: float | None = None
+    consumption_total: float | None = None
+    quality: str | None = None
+    # The (size, level, volume) last validated and whether it passed
+    validated_inputs: tuple[Any, Any, Any] | None = None
+    validated_ok: bool = False
+
+
 class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -58,15 +76,19 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
             LOGGER,
             name="Superior Plus Propane",
             update_interval=self._normal_interval,
+            # Listeners only run when a refresh actually changes the data
+            always_update=False,
         )
         self.config_entry = config_entry
-        self._previous_readings: dict[str, float] = {}
-        self._consumption_totals: dict[str, float] = {}
+        self._tank_states: dict[str, TankState] = {}
         self._smoothed_state: dict[str, dict[str, float]] = {}
         self._store = Store(
             hass, STORAGE_VERSION, f"{STORAGE_KEY}_{config_entry.entry_id}"
         )
-        self._data_quality_flags: dict[str, str] = {}
+        # Serialized form of the last saved state, to skip unchanged saves
+        self._saved_fingerprint: bytes | None = None
+        self._consumption_dirty = False
+        self._save_pending = False
         self._use_dynamic_thresholds = config_entry.data.get(
             "adaptive_thresholds", True
         )
@@ -76,28 +98,91 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
         self._max_threshold_override = config_entry.data.get(
             "max_consumption_threshold"
         )
-        self.last_successful_update_time: datetime | None = None
+        # Monotonic time of the last successful refresh
+        self._last_success_monotonic: float | None = None
+        # Parsed last_delivery strings; they change at most once a day
+        self._delivery_dates: dict[str, date | None] = {}
+        # Tanks from the latest refresh keyed by tank_id, for entity lookups
+        self.tanks_by_id: dict[str, dict[str, Any]] = {}
+        # Device info shared by every entity of a tank
+        self.device_info_by_tank: dict[str, DeviceInfo] = {}
 
     async def async_load_consumption_data(self) -> None:
         """Load consumption data from storage."""
         stored_data = await self._store.async_load()
         if stored_data:
-            self._consumption_totals = stored_data.get("consumption_totals", {})
-            self._previous_readings = stored_data.get("previous_readings", {})
+            for tank_id, total in stored_data.get("consumption_totals", {}).items():
+                self._tank_state(tank_id).consumption_total = total
+            for tank_id, volume in stored_data.get("previous_readings", {}).items():
+                self._tank_state(tank_id).previous_volume = volume
             self._smoothed_state = stored_data.get("smoothed_state", {})
-            LOGGER.debug("Loaded consumption data: %s", self._consumption_totals)
+            self._saved_fingerprint = self._consumption_fingerprint()
+            LOGGER.debug("Loaded consumption data: %s", self._persisted_state()[0])
+
+    def _tank_state(self, tank_id: str) -> TankState:
+        """Return the tracking state for a tank, creating it if needed."""
+        state = self._tank_states.get(tank_id)
+        if state is None:
+            state = self._tank_states[tank_id] = TankState()
+        return state
+
+    def _persisted_state(self) -> tuple[dict[str, float], dict[str, float]]:
+        """Return the consumption totals and previous readings as stored."""
+        totals = {}
+        previous_readings = {}
+        for tank_id, state in self._tank_states.items():
+            if state.consumption_total is not None:
+                totals[tank_id] = state.consumption_total
+            if state.previous_volume is not None:
+                previous_readings[tank_id] = state.previous_volume
+        return totals, previous_readings
+
+    def _consumption_fingerprint(self) -> bytes:
+        """Serialize the persisted consumption state for change detection."""
+        return orjson.dumps((*self._persisted_state(), self._smoothed_state))
+
+    def _async_schedule_save(self) -> None:
+        """Queue a delayed write if the consumption state has changed."""
+        if not self._consumption_dirty:
+            return
+        self._consumption_dirty = False
 
-    async def async_save_consumption_data(self) -> None:
-        """Save consumption data to storage."""
-        data = {
+        fingerprint = self._consumption_fingerprint()
+        if fingerprint == self._saved_fingerprint:
+            LOGGER.debug("Consumption data unchanged, skipping save")
+            return
+
+        self._saved_fingerprint = fingerprint
+        self._save_pending = True
+        # Store coalesces repeated calls and flushes pending writes on shutdown
+        self._store.async_delay_save(self._consumption_payload, SAVE_DELAY)
+
+    def _consumption_payload(self) -> dict[str, Any]:
+        """Build the stored consumption payload; called when the write runs."""
+        self._save_pending = False
+        totals, previous_readings = self._persisted_state()
+        LOGGER.debug("Saving consumption data: %s", totals)
+        return {
             "version": STORAGE_VERSION,
-            "consumption_totals": self._consumption_totals,
-            "previous_readings": self._previous_readings,
+            "consumption_totals": totals,
+            "previous_readings": previous_readings,
             "smoothed_state": self._smoothed_state,
             "last_updated": datetime.now(UTC).isoformat(),
         }
-        await self._store.async_save(data)
-        LOGGER.debug("Saved consumption data: %s", self._consumption_totals)
+
+    async def async_save_consumption_data(self) -> None:
+        """Write any unsaved consumption data to storage now."""
+        self._async_schedule_save()
+        if self._save_pending:
+            await self._store.async_save(self._consumption_payload())
+
+    async def async_shutdown(self) -> None:
+        """Flush a queued consumption write before the entry goes away."""
+        await super().async_shutdown()
+        try:
+            await self.async_save_consumption_data()
+        except Exception:  # noqa: BLE001
+            LOGGER.warning("Failed to save consumption data", exc_info=True)
 
     def _record_smoothed_transition(
         self, tank_id: str, consumption_energy: float
@@ -110,34 +195,55 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
             elapsed_hours = max(0.0, (now_ts - prev["time"]) / SECONDS_PER_HOUR)
             if elapsed_hours > 0:
                 rate = consumption_energy / elapsed_hours
+        self._consumption_dirty = True
         self._smoothed_state[tank_id] = {
             "time": now_ts,
-            "total_at_transition": self._consumption_totals.get(tank_id, 0.0),
+            "total_at_transition": self._tank_state(tank_id).consumption_total or 0.0,
             "rate_per_hour": rate,
             "projection_cap": consumption_energy,
         }
 
     def get_smoothed_consumption_total(self, tank_id: str) -> float:
         """Smoothed cumulative consumption (linear projection between plateau steps)."""
-        raw_total = self._consumption_totals.get(tank_id, 0.0)
-        state = self._smoothed_state.get(tank_id)
-        if not state:
-            return raw_total
+        smoothed = self._smoothed_state.get(tank_id)
+        if not smoothed:
+            tank_state = self._tank_states.get(tank_id)
+            return (tank_state and tank_state.consumption_total) or 0.0
         elapsed_hours = max(
-            0.0, (datetime.now(UTC).timestamp() - state["time"]) / SECONDS_PER_HOUR
+            0.0, (datetime.now(UTC).timestamp() - smoothed["time"]) / SECONDS_PER_HOUR
         )
         projected = min(
-            state["rate_per_hour"] * elapsed_hours,
-            state["projection_cap"],
+            smoothed["rate_per_hour"] * elapsed_hours,
+            smoothed["projection_cap"],
         )
-        return state["total_at_transition"] + projected
+        return smoothed["total_at_transition"] + projected
+
+    def _with_current_projection(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of data with each tank's smoothed total brought up to now."""
+        tanks = [
+            {
+                **tank,
+                "consumption_smoothed": self.get_smoothed_consumption_total(
+                    tank["tank_id"]
+                ),
+            }
+            if isinstance(tank, dict) and tank.get("tank_id")
+            else tank
+            for tank in data["tanks"]
+        ]
+        self.tanks_by_id = {
+            tank["tank_id"]: tank
+            for tank in tanks
+            if isinstance(tank, dict) and tank.get("tank_id")
+        }
+        return {**data, "tanks": tanks}
 
     def _is_data_fresh(self) -> bool:
         """Check if existing data is fresh enough to serve as stale fallback."""
-        if not self.last_successful_update_time:
+        if self._last_success_monotonic is None:
             return False
-        age = datetime.now(UTC) - self.last_successful_update_time
-        return age < timedelta(hours=MAX_STALE_DATA_HOURS)
+        age = time.monotonic() - self._last_success_monotonic
+        return age < MAX_STALE_DATA_SECONDS
 
     def _calculate_dynamic_thresholds(
         self, tank_size: float, update_interval_hours: float
@@ -145,63 +251,47 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
         """Calculate dynamic consumption thresholds."""
         rc = self.region_config
 
-        if (
-            self._min_threshold_override is not None
-            and self._max_threshold_override is not None
-        ):
-            return self._min_threshold_override, self._max_threshold_override
-
-        if (
-            self._min_threshold_override is not None
-            or self._max_threshold_override is not None
-        ):
-            if self._use_dynamic_thresholds:
-                min_dynamic = (
-                    tank_size * MIN_CONSUMPTION_PERCENTAGE * update_interval_hours
-                )
-                max_dynamic = (
-                    tank_size * MAX_CONSUMPTION_PERCENTAGE * update_interval_hours
-                )
-                min_dynamic = max(rc.absolute_min_consumption, min_dynamic)
-                max_dynamic = min(rc.absolute_max_consumption, max_dynamic)
-                min_threshold = (
-                    self._min_threshold_override
-                    if self._min_threshold_override is not None
-                    else min_dynamic
-                )
-                max_threshold = (
-                    self._max_threshold_override
-                    if self._max_threshold_override is not None
-                    else max_dynamic
-                )
-                return min_threshold, max_threshold
-            return (
-                (
-                    self._min_threshold_override
-                    if self._min_threshold_override is not None
-                    else rc.default_min_threshold
-                ),
-                (
-                    self._max_threshold_override
-                    if self._max_threshold_override is not None
-                    else rc.default_max_threshold
-                ),
+        # Each override wins on its own; unset ones fall back to the dynamic
+        # range, or to the region defaults when adaptive thresholds are off
+        if self._use_dynamic_thresholds:
+            min_threshold = max(
+                rc.absolute_min_consumption,
+                tank_size * MIN_CONSUMPTION_PERCENTAGE * update_interval_hours,
             )
+            max_threshold = min(
+                rc.absolute_max_consumption,
+                tank_size * MAX_CONSUMPTION_PERCENTAGE * update_interval_hours,
+            )
+        else:
+            min_threshold = rc.default_min_threshold
+            max_threshold = rc.default_max_threshold
+
+        return (
+            min_threshold
+            if self._min_threshold_override is None
+            else self._min_threshold_override,
+            max_threshold
+            if self._max_threshold_override is None
+            else self._max_threshold_override,
+        )
 
-        if not self._use_dynamic_thresholds:
-            return rc.default_min_threshold, rc.default_max_threshold
-
-        min_consumption = tank_size * MIN_CONSUMPTION_PERCENTAGE * update_interval_hours
-        max_consumption = tank_size * MAX_CONSUMPTION_PERCENTAGE * update_interval_hours
-
-        min_consumption = max(rc.absolute_min_consumption, min_consumption)
-        max_consumption = min(rc.absolute_max_consumption, max_consumption)
-
-        return min_consumption, max_consumption
-
-    def _validate_tank_data(self, tank: dict[str, Any]) -> bool:  # noqa: PLR0911
+    def _validate_tank_data(
+        self, tank_id: str, state: TankState, tank: dict[str, Any]
+    ) -> bool:
+        """Validate tank data, reusing the last result for unchanged inputs."""
+        inputs = (tank.get("tank_size"), tank.get("level"), tank.get("current_volume"))
+        if state.validated_inputs == inputs:
+            # The quality flag is still the one this input produced last time
+            return state.validated_ok
+
+        state.validated_ok = self._check_tank_data(tank_id, state, tank)
+        state.validated_inputs = inputs
+        return state.validated_ok
+
+    def _check_tank_data(  # noqa: PLR0911
+        self, tank_id: str, state: TankState, tank: dict[str, Any]
+    ) -> bool:
         """Validate tank data consistency and set quality flags."""
-        tank_id = tank.get("tank_id", "unknown")
         rc = self.region_config
 
         try:
@@ -212,10 +302,10 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                     tank_id,
                     tank_size,
                 )
-                self._data_quality_flags[tank_id] = "Invalid Tank Size"
+                state.quality = "Invalid Tank Size"
                 return False
         except (ValueError, TypeError):
-            self._data_quality_flags[tank_id] = "Invalid Tank Size"
+            state.quality = "Invalid Tank Size"
             return False
 
         try:
@@ -227,10 +317,10 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                     tank_id,
                     level,
                 )
-                self._data_quality_flags[tank_id] = "Invalid Level"
+                state.quality = "Invalid Level"
                 return False
         except (ValueError, TypeError):
-            self._data_quality_flags[tank_id] = "Invalid Level"
+            state.quality = "Invalid Level"
             return False
 
         try:
@@ -253,20 +343,23 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                         tank_size,
                         variance_pct,
                     )
-                    self._data_quality_flags[tank_id] = "Inconsistent Values"
+                    state.quality = "Inconsistent Values"
                     return False
-                self._data_quality_flags[tank_id] = "Good"
+                state.quality = "Good"
         except (ValueError, TypeError, ZeroDivisionError, ArithmeticError):
-            self._data_quality_flags[tank_id] = "Calculation Error"
+            state.quality = "Calculation Error"
             return False
 
-        if tank_id not in self._data_quality_flags:
-            self._data_quality_flags[tank_id] = "Good"
+        if state.quality is None:
+            state.quality = "Good"
 
         return True
 
-    def _process_tank_consumption(  # noqa: PLR0912, PLR0915
-        self, tank: dict[str, Any]
+    def _process_tank_consumption(  # noqa: PLR0915
+        self,
+        tank: dict[str, Any],
+        update_interval_hours: float,
+        thresholds_by_size: dict[float, tuple[float, float]],
     ) -> None:
         """Process consumption tracking for a single tank."""
         tank_id = tank.get("tank_id")
@@ -277,31 +370,36 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
         tank["refill_detected"] = False
         tank["consumption_anomaly"] = False
 
-        if not self._validate_tank_data(tank):
+        state = self._tank_state(tank_id)
+
+        if not self._validate_tank_data(tank_id, state, tank):
             LOGGER.debug("Tank %s data validation failed", tank_id)
-            tank["consumption_total"] = self._consumption_totals.get(tank_id, 0.0)
+            tank["consumption_total"] = state.consumption_total or 0.0
             tank["consumption_rate"] = 0.0
-            tank["data_quality"] = self._data_quality_flags.get(tank_id, "Unknown")
+            tank["data_quality"] = state.quality or "Unknown"
             return
 
         try:
             current_volume = float(tank.get("current_volume", "0"))
             tank_size = float(tank.get("tank_size", 500))
         except (ValueError, TypeError):
-            tank["consumption_total"] = self._consumption_totals.get(tank_id, 0.0)
+            tank["consumption_total"] = state.consumption_total or 0.0
             tank["consumption_rate"] = 0.0
             tank["data_quality"] = "Unknown"
             return
 
-        rc = self.region_config
-        interval = self.update_interval or self._normal_interval
-        update_interval_hours = max(0.001, interval.total_seconds() / SECONDS_PER_HOUR)
-        min_threshold, max_threshold = self._calculate_dynamic_thresholds(
-            tank_size, update_interval_hours
-        )
+        energy_factor = self.region_config.volume_to_energy_factor
+        thresholds = thresholds_by_size.get(tank_size)
+        if thresholds is None:
+            thresholds = self._calculate_dynamic_thresholds(
+                tank_size, update_interval_hours
+            )
+            thresholds_by_size[tank_size] = thresholds
+        min_threshold, max_threshold = thresholds
 
-        if tank_id in self._previous_readings:
-            previous_volume = self._previous_readings[tank_id]
+        consumption_rate = 0.0
+        previous_volume = state.previous_volume
+        if previous_volume is not None:
             consumption_volume = previous_volume - current_volume
 
             if consumption_volume < 0:
@@ -313,10 +411,9 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                 )
                 tank["refill_detected"] = True
             elif consumption_volume > 0:
-                consumption_energy = consumption_volume * rc.volume_to_energy_factor
-
-                if tank_id not in self._consumption_totals:
-                    self._consumption_totals[tank_id] = 0.0
+                consumption_energy = consumption_volume * energy_factor
+                total = (state.consumption_total or 0.0) + consumption_energy
+                state.consumption_total = total
 
                 if consumption_volume < min_threshold:
                     LOGGER.info(
@@ -325,7 +422,6 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                         consumption_volume,
                         min_threshold,
                     )
-                    self._consumption_totals[tank_id] += consumption_energy
                 elif consumption_volume > max_threshold:
                     LOGGER.warning(
                         "Tank %s high consumption: %.2f [above threshold: %.2f]",
@@ -333,76 +429,91 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                         consumption_volume,
                         max_threshold,
                     )
-                    self._consumption_totals[tank_id] += consumption_energy
                     tank["consumption_anomaly"] = True
                 else:
-                    self._consumption_totals[tank_id] += consumption_energy
                     LOGGER.debug(
                         "Tank %s consumed %.2f. Total energy: %.3f",
                         tank_id,
                         consumption_volume,
-                        self._consumption_totals[tank_id],
+                        total,
                     )
 
                 self._record_smoothed_transition(tank_id, consumption_energy)
+                # update_interval_hours is floored above zero by the caller
+                consumption_rate = round(consumption_energy / update_interval_hours, 4)
 
-        actual_previous = self._previous_readings.get(tank_id)
-        self._previous_readings[tank_id] = current_volume
+        if previous_volume != current_volume:
+            state.previous_volume = current_volume
+            self._consumption_dirty = True
 
-        tank["consumption_total"] = self._consumption_totals.get(tank_id, 0.0)
+        tank["consumption_total"] = state.consumption_total or 0.0
 
-        if actual_previous is not None and update_interval_hours > 0:
-            consumption_volume = actual_previous - current_volume
-            if consumption_volume > 0:
-                consumption_energy = consumption_volume * rc.volume_to_energy_factor
-                tank["consumption_rate"] = round(
-                    consumption_energy / update_interval_hours, 4
-                )
-            else:
-                tank["consumption_rate"] = 0.0
-        else:
-            tank["consumption_rate"] = 0.0
+        tank["consumption_rate"] = consumption_rate
 
-        tank["data_quality"] = self._data_quality_flags.get(tank_id, "Unknown")
+        tank["data_quality"] = state.quality or "Unknown"
 
-        last_delivery = tank.get("last_delivery", "unknown")
-        if last_delivery != "unknown":
+    def days_since_delivery(self, tank: dict[str, Any]) -> int | None:
+        """Return whole UTC days since the tank's last delivery, if known."""
+        delivery_date = self._parse_delivery_date(tank.get("last_delivery", "unknown"))
+        if delivery_date is None:
+            return None
+        return (datetime.now(UTC).date() - delivery_date).days
+
+    def _parse_delivery_date(self, last_delivery: Any) -> date | None:
+        """Return the parsed YYYY-MM-DD delivery date, or None if unknown."""
+        if last_delivery == "unknown" or not isinstance(last_delivery, str):
+            return None
+        if last_delivery in self._delivery_dates:
+            return self._delivery_dates[last_delivery]
+        try:
+            delivery_date = date.fromisoformat(last_delivery)
+        except ValueError:
             try:
-                delivery_date = datetime.strptime(last_delivery, "%Y-%m-%d").replace(
-                    tzinfo=UTC
+                # fromisoformat rejects the unpadded dates strptime accepted
+                delivery_date = (
+                    datetime.strptime(last_delivery, "%Y-%m-%d")
+                    .replace(tzinfo=UTC)
+                    .date()
                 )
-                days_since = (datetime.now(UTC) - delivery_date).days
-                tank["days_since_delivery"] = days_since
-            except (ValueError, TypeError):
-                tank["days_since_delivery"] = "unknown"
-        else:
-            tank["days_since_delivery"] = "unknown"
+            except ValueError:
+                delivery_date = None
+        self._delivery_dates[last_delivery] = delivery_date
+        return delivery_date
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
             client = self.config_entry.runtime_data.client
-            tanks_data = await client.async_get_tanks_data()
-            orders_data = await client.async_get_orders_data()
+            tanks_data, orders_data = await client.async_get_all()
+
+            # Invariant for the whole refresh; tanks of equal size share
+            # their thresholds
+            interval = self.update_interval or self._normal_interval
+            update_interval_hours = max(
+                0.001, interval.total_seconds() / SECONDS_PER_HOUR
+            )
+            thresholds_by_size: dict[float, tuple[float, float]] = {}
 
             for tank in tanks_data:
                 try:
-                    self._process_tank_consumption(tank)
+                    self._process_tank_consumption(
+                        tank, update_interval_hours, thresholds_by_size
+                    )
 
                     tank_id = tank.get("tank_id")
-                    if tank_id and self._data_quality_flags.get(tank_id) != "Good":
-                        LOGGER.info(
-                            "Tank %s data quality: %s",
-                            tank_id,
-                            self._data_quality_flags.get(tank_id, "Unknown"),
+                    if tank_id:
+                        # Part of the payload so the projection between
+                        # plateaus still counts as changed data
+                        tank["consumption_smoothed"] = (
+                            self.get_smoothed_consumption_total(tank_id)
                         )
+                        quality = self._tank_state(tank_id).quality or "Unknown"
+                        if quality != "Good":
+                            LOGGER.info("Tank %s data quality: %s", tank_id, quality)
                 except Exception:  # noqa: BLE001
                     LOGGER.exception("Error processing tank data — continuing")
 
-            try:
-                await self.async_save_consumption_data()
-            except Exception:  # noqa: BLE001
-                LOGGER.warning("Failed to save consumption data", exc_info=True)
+            self._async_schedule_save()
 
         except SuperiorPlusPropaneApiClientAuthenticationError as exc:
             msg = f"Authentication failed: {exc}"
@@ -415,7 +526,9 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
                 self.update_interval = self._retry_interval
             if self.data and self._is_data_fresh():
                 LOGGER.debug("Returning stale data due to communication error")
-                return self.data
+                # Advance the smoothed projection, or always_update=False
+                # would leave its sensor frozen for the whole outage
+                return self._with_current_projection(self.data)
             msg = f"Communication error: {exc}"
             raise UpdateFailed(msg) from exc
 
@@ -425,5 +538,10 @@ class SuperiorPlusPropaneDataUpdateCoordinator(DataUpdateCoordinator):
             raise UpdateFailed(msg) from exc
         else:
             self.update_interval = self._normal_interval
-            self.last_successful_update_time = datetime.now(UTC)
+            self._last_success_monotonic = time.monotonic()
+            self.tanks_by_id = {
+                tank["tank_id"]: tank
+                for tank in tanks_data
+                if isinstance(tank, dict) and tank.get("tank_id")
+            }
             return {"tanks": tanks_data, "orders": orders_data}
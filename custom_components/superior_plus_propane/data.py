@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import aiohttp
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
@@ -22,6 +23,7 @@ class SuperiorPlusPropaneData:
     """Data for the Superior Plus Propane integration."""
 
     client: SuperiorPropaneApiBase
+    session: aiohttp.ClientSession
     coordinator: SuperiorPlusPropaneDataUpdateCoordinator
     integration: Integration
     region_config: RegionConfig
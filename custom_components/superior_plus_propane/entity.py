@@ -28,10 +28,19 @@ class SuperiorPlusPropaneEntity(
         self._tank_id = tank_data["tank_id"]
         self._tank_address = tank_data["address"]
 
-        region_config = coordinator.region_config
-        self._attr_has_entity_name = region_config.has_entity_name
+        self._attr_has_entity_name = coordinator.region_config.has_entity_name
 
-        # Build device info
+        # Every entity of a tank shares one device info
+        device_info = coordinator.device_info_by_tank.get(self._tank_id)
+        if device_info is None:
+            device_info = coordinator.device_info_by_tank[self._tank_id] = (
+                self._build_device_info(tank_data)
+            )
+        self._attr_device_info = device_info
+
+    def _build_device_info(self, tank_data: dict[str, Any]) -> DeviceInfo:
+        """Build the device info for this entity's tank."""
+        region_config = self.coordinator.region_config
         tank_size = tank_data.get("tank_size", "unknown")
         volume_unit = region_config.volume_unit
         model = (
@@ -55,15 +64,10 @@ class SuperiorPlusPropaneEntity(
         if serial_number != "unknown":
             device_info_kwargs["serial_number"] = serial_number
 
-        self._attr_device_info = DeviceInfo(**device_info_kwargs)
+        return DeviceInfo(**device_info_kwargs)
 
     def _get_tank_data(self) -> dict[str, Any] | None:
         """Get current tank data from coordinator."""
         if not self.coordinator.data:
             return None
-
-        tanks = self.coordinator.data.get("tanks", [])
-        for tank in tanks:
-            if isinstance(tank, dict) and tank.get("tank_id") == self._tank_id:
-                return tank
-        return None
+        return self.coordinator.tanks_by_id.get(self._tank_id)
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RegionConfig:
     """Configuration for a specific region."""
 
@@ -42,6 +47,15 @@ class RegionConfig:
     retry_delay_seconds: int
     retry_interval: int
     auth_settle_delay: int
+    auth_ttl_seconds: int
+
+    # Timeouts in seconds: one data request, and a whole paginated tank fetch
+    data_request_timeout: int
+    tank_fetch_timeout: int
+
+    # Connection pooling
+    max_connections: int
+    keepalive_timeout: float
 
     # Feature flags
     has_entity_name: bool
@@ -72,6 +86,11 @@ US_REGION_CONFIG = RegionConfig(
     retry_delay_seconds=5,
     retry_interval=300,
     auth_settle_delay=0,
+    auth_ttl_seconds=0,
+    data_request_timeout=10,
+    tank_fetch_timeout=60,
+    max_connections=4,
+    keepalive_timeout=75.0,
     has_entity_name=False,
     has_per_tank_price=True,
 )
@@ -100,14 +119,23 @@ CA_REGION_CONFIG = RegionConfig(
     retry_delay_seconds=60,
     retry_interval=300,
     auth_settle_delay=8,
+    auth_ttl_seconds=300,
+    data_request_timeout=60,
+    # Covers one page's full retry schedule: 4 requests of up to 60 s
+    # plus the jittered 30/60/120 s backoffs, at most 315 s
+    tank_fetch_timeout=600,
+    max_connections=4,
+    keepalive_timeout=600.0,
     has_entity_name=True,
     has_per_tank_price=False,
 )
 
-REGION_CONFIGS: dict[str, RegionConfig] = {
-    "us": US_REGION_CONFIG,
-    "ca": CA_REGION_CONFIG,
-}
+REGION_CONFIGS: Mapping[str, RegionConfig] = MappingProxyType(
+    {
+        "us": US_REGION_CONFIG,
+        "ca": CA_REGION_CONFIG,
+    }
+)
 
 
 def get_region_config(region: str) -> RegionConfig:
@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfTime,
 )
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_utc_time_change
 
 from .const import CONF_INCLUDE_UNMONITORED, DOMAIN, LOGGER
 from .entity import SuperiorPlusPropaneEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -26,22 +33,115 @@ if TYPE_CHECKING:
     from .region import RegionConfig
 
 
-def _build_unique_id(tank_data: dict[str, Any], suffix: str) -> str:
-    """Build a unique ID for a sensor, including customer_number for CA."""
+@dataclass(frozen=True, kw_only=True)
+class SuperiorPlusPropaneSensorEntityDescription(SensorEntityDescription):
+    """Describes a tank sensor and how to read its value from the tank data."""
+
+    # Tank data key holding the value; "unknown" there means no value
+    data_key: str = ""
+    # Applied to the raw value; None passes it through unchanged
+    converter: Callable[[Any], Any] | None = float
+    # RegionConfig attributes for the unit and the display scaling factor
+    unit_attr: str | None = None
+    display_factor_attr: str | None = None
+    # Decimal places to round the scaled value to
+    round_digits: int | None = None
+
+
+ENTITY_DESCRIPTIONS = (
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="level",
+        name="Level",
+        data_key="level",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:gauge",
+    ),
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="volume",
+        name="Current Volume",
+        data_key="current_volume",
+        unit_attr="volume_unit",
+        device_class=SensorDeviceClass.VOLUME_STORAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:propane-tank",
+    ),
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="capacity",
+        name="Capacity",
+        data_key="tank_size",
+        unit_attr="volume_unit",
+        device_class=SensorDeviceClass.VOLUME_STORAGE,
+        icon="mdi:propane-tank-outline",
+    ),
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="reading_date",
+        name="Reading Date",
+        data_key="reading_date",
+        converter=None,
+        icon="mdi:calendar-clock",
+    ),
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="last_delivery",
+        name="Last Delivery",
+        data_key="last_delivery",
+        converter=None,
+        icon="mdi:truck-delivery",
+    ),
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="consumption_total",
+        name="Total Consumption",
+        data_key="consumption_total",
+        unit_attr="consumption_display_unit",
+        display_factor_attr="consumption_display_factor",
+        device_class=SensorDeviceClass.GAS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:fire",
+    ),
+    SuperiorPlusPropaneSensorEntityDescription(
+        key="consumption_rate",
+        name="Consumption Rate",
+        data_key="consumption_rate",
+        unit_attr="rate_display_unit",
+        display_factor_attr="rate_display_factor",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer",
+    ),
+)
+
+PRICE_ENTITY_DESCRIPTION = SuperiorPlusPropaneSensorEntityDescription(
+    key="price",
+    name="Price per Unit",
+    data_key="price_per_unit",
+    unit_attr="price_unit",
+    display_factor_attr="price_display_factor",
+    round_digits=5,
+    device_class=SensorDeviceClass.MONETARY,
+    icon="mdi:currency-usd",
+)
+
+_QUALITY_ICONS = {
+    "Good": "mdi:shield-check",
+    "Inconsistent Values": "mdi:shield-alert",
+    "Invalid Level": "mdi:shield-off",
+    "Invalid Tank Size": "mdi:shield-off",
+    "Calculation Error": "mdi:shield-off",
+}
+
+
+def _build_tank_prefixes(
+    region_config: RegionConfig, tank_data: dict[str, Any]
+) -> tuple[str, str]:
+    """Build a tank's unique ID base (with customer_number for CA) and name prefix."""
     customer_number = tank_data.get("customer_number", "unknown")
     tank_id = tank_data["tank_id"]
     if customer_number != "unknown":
-        return f"{DOMAIN}_{customer_number}_{tank_id}_{suffix}"
-    return f"{DOMAIN}_{tank_id}_{suffix}"
-
-
-def _build_sensor_name(
-    region_config: RegionConfig, tank_data: dict[str, Any], label: str
-) -> str:
-    """Build a sensor name, using full address for US or short label for CA."""
+        uid_base = f"{DOMAIN}_{customer_number}_{tank_id}"
+    else:
+        uid_base = f"{DOMAIN}_{tank_id}"
     if region_config.has_entity_name:
-        return label
-    return f"{tank_data['address']} {label}"
+        return uid_base, ""
+    return uid_base, f"{tank_data['address']} "
 
 
 async def async_setup_entry(
@@ -76,403 +176,180 @@ async def async_setup_entry(
             LOGGER.debug("Skipping unmonitored tank: %s", tank_id)
             continue
 
+        # Unique ID and name prefixes are built once and shared by the sensors
+        args = (
+            coordinator,
+            tank_data,
+            _build_tank_prefixes(region_config, tank_data),
+        )
+
         entities.extend(
-            [
-                SuperiorPlusPropaneLevelSensor(coordinator, tank_data, region_config),
-                SuperiorPlusPropaneVolumeSensor(coordinator, tank_data, region_config),
-                SuperiorPlusPropaneCapacitySensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneReadingDateSensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneLastDeliverySensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneDaysSinceDeliverySensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneConsumptionTotalSensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneSmoothedConsumptionSensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneConsumptionRateSensor(
-                    coordinator, tank_data, region_config
-                ),
-                SuperiorPlusPropaneDataQualitySensor(
-                    coordinator, tank_data, region_config
-                ),
-            ]
+            SuperiorPlusPropaneSensor(*args, entity_description)
+            for entity_description in ENTITY_DESCRIPTIONS
         )
+        entities.append(SuperiorPlusPropaneDaysSinceDeliverySensor(*args))
+        entities.append(SuperiorPlusPropaneSmoothedConsumptionSensor(*args))
+        entities.append(SuperiorPlusPropaneDataQualitySensor(*args))
 
         if region_config.has_per_tank_price:
-            entities.append(
-                SuperiorPlusPropanePriceSensor(coordinator, tank_data, region_config)
-            )
+            entities.append(SuperiorPlusPropaneSensor(*args, PRICE_ENTITY_DESCRIPTION))
 
     # Add average price sensor (reads from orders data, one per integration)
     if tanks:
         entities.append(
-            SuperiorPlusPropaneAveragePriceSensor(coordinator, tanks[0], region_config)
+            SuperiorPlusPropaneAveragePriceSensor(
+                coordinator,
+                tanks[0],
+                _build_tank_prefixes(region_config, tanks[0]),
+            )
         )
 
     async_add_entities(entities)
 
 
-class SuperiorPlusPropaneLevelSensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Tank level percentage sensor."""
+class SuperiorPlusPropaneSensor(SuperiorPlusPropaneEntity, SensorEntity):
+    """Tank sensor driven by its entity description."""
 
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "level")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Level")
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = None
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:gauge"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current tank level percentage."""
-        tank_data = self._get_tank_data()
-        if not tank_data:
-            return None
-
-        level_str = tank_data.get("level", "unknown")
-        if level_str == "unknown":
-            return None
-
-        try:
-            return float(level_str)
-        except (ValueError, TypeError):
-            return None
-
-
-class SuperiorPlusPropaneVolumeSensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Current volume sensor."""
+    entity_description: SuperiorPlusPropaneSensorEntityDescription
 
     def __init__(
         self,
         coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
         tank_data: dict[str, Any],
-        region_config: RegionConfig,
+        prefixes: tuple[str, str],
+        entity_description: SuperiorPlusPropaneSensorEntityDescription | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "volume")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Current Volume")
-        self._attr_native_unit_of_measurement = region_config.volume_unit
-        self._attr_device_class = SensorDeviceClass.VOLUME_STORAGE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:propane-tank"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current volume in tank."""
-        tank_data = self._get_tank_data()
-        if not tank_data:
-            return None
-
-        volume_str = tank_data.get("current_volume", "unknown")
-        if volume_str == "unknown":
-            return None
-
-        try:
-            return float(volume_str)
-        except (ValueError, TypeError):
-            return None
-
-
-class SuperiorPlusPropaneCapacitySensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Tank capacity sensor."""
-
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "capacity")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Capacity")
-        self._attr_native_unit_of_measurement = region_config.volume_unit
-        self._attr_device_class = SensorDeviceClass.VOLUME_STORAGE
-        self._attr_state_class = None
-        self._attr_icon = "mdi:propane-tank-outline"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the tank capacity."""
-        tank_data = self._get_tank_data()
-        if not tank_data:
-            return None
-
-        capacity_str = tank_data.get("tank_size", "unknown")
-        if capacity_str == "unknown":
-            return None
-
-        try:
-            return float(capacity_str)
-        except (ValueError, TypeError):
-            return None
-
-
-class SuperiorPlusPropaneReadingDateSensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Reading date sensor."""
-
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "reading_date")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Reading Date")
-        self._attr_device_class = None
-        self._attr_icon = "mdi:calendar-clock"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the reading date."""
-        tank_data = self._get_tank_data()
-        if not tank_data:
-            return None
-
-        reading_date = tank_data.get("reading_date", "unknown")
-        return None if reading_date == "unknown" else reading_date
-
-
-class SuperiorPlusPropaneLastDeliverySensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Last delivery date sensor."""
-
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "last_delivery")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Last Delivery")
-        self._attr_device_class = None
-        self._attr_icon = "mdi:truck-delivery"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the last delivery date."""
-        tank_data = self._get_tank_data()
-        if not tank_data:
+        # Subclasses declare their description on the class instead
+        if entity_description is not None:
+            self.entity_description = entity_description
+        description = self.entity_description
+
+        uid_base, name_prefix = prefixes
+        self._attr_unique_id = f"{uid_base}_{description.key}"
+        self._attr_name = f"{name_prefix}{description.name}"
+
+        region_config = coordinator.region_config
+        if description.unit_attr is not None:
+            self._attr_native_unit_of_measurement = getattr(
+                region_config, description.unit_attr
+            )
+        self._display_factor: float | None = (
+            getattr(region_config, description.display_factor_attr)
+            if description.display_factor_attr is not None
+            else None
+        )
+        self._attr_native_value = self._value_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the value once per refresh rather than on every state read."""
+        self._attr_native_value = self._value_from_data()
+        super()._handle_coordinator_update()
+
+    def _convert(self, raw: Any) -> Any:
+        """Convert, scale and round a raw value; None if it is not usable."""
+        description = self.entity_description
+        if raw is None or raw == "unknown":
             return None
-
-        delivery_date = tank_data.get("last_delivery", "unknown")
-        return None if delivery_date == "unknown" else delivery_date
-
-
-class SuperiorPlusPropanePriceSensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Price per unit sensor."""
-
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "price")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Price per Unit")
-        self._attr_native_unit_of_measurement = region_config.price_unit
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = None
-        self._attr_icon = "mdi:currency-usd"
-        self._price_display_factor = region_config.price_display_factor
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the price per unit."""
+        if description.converter is None:
+            return raw
+
+        if description.converter is float and type(raw) is float:
+            # Coordinator-computed values need no parsing
+            value = raw
+        else:
+            try:
+                value = description.converter(raw)
+            except (ValueError, TypeError):
+                return None
+        if self._display_factor is not None:
+            value *= self._display_factor
+        if description.round_digits is not None:
+            value = round(value, description.round_digits)
+        return value
+
+    def _value_from_data(self) -> Any:
+        """Return the sensor value from the tank data."""
         tank_data = self._get_tank_data()
         if not tank_data:
             return None
 
-        price_str = tank_data.get("price_per_unit", "unknown")
-        if price_str == "unknown":
-            return None
-
-        try:
-            return round(float(price_str) * self._price_display_factor, 5)
-        except (ValueError, TypeError):
-            return None
+        return self._convert(tank_data.get(self.entity_description.data_key))
 
 
-class SuperiorPlusPropaneDaysSinceDeliverySensor(
-    SuperiorPlusPropaneEntity, SensorEntity
-):
+class SuperiorPlusPropaneDaysSinceDeliverySensor(SuperiorPlusPropaneSensor):
     """Days since last delivery sensor."""
 
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "days_since_delivery")
-        self._attr_name = _build_sensor_name(
-            region_config, tank_data, "Days Since Delivery"
+    entity_description = SuperiorPlusPropaneSensorEntityDescription(
+        key="days_since_delivery",
+        name="Days Since Delivery",
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-today",
+    )
+
+    async def async_added_to_hass(self) -> None:
+        """Also refresh the state when the UTC date rolls over."""
+        await super().async_added_to_hass()
+        # The count is derived from the clock rather than carried in the
+        # coordinator data, so it would otherwise wait for a data change
+        self.async_on_remove(
+            async_track_utc_time_change(
+                self.hass, self._async_date_changed, hour=0, minute=0, second=0
+            )
         )
-        self._attr_native_unit_of_measurement = UnitOfTime.DAYS
-        self._attr_device_class = None
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:calendar-today"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return days since last delivery."""
-        tank_data = self._get_tank_data()
-        if not tank_data:
-            return None
-
-        days_since = tank_data.get("days_since_delivery", "unknown")
-        if days_since == "unknown":
-            return None
-
-        try:
-            return int(days_since)
-        except (ValueError, TypeError):
-            return None
-
-
-class SuperiorPlusPropaneConsumptionTotalSensor(
-    SuperiorPlusPropaneEntity, SensorEntity
-):
-    """Total consumption sensor for energy dashboard."""
+    @callback
+    def _async_date_changed(self, _now: datetime) -> None:
+        """Write the new day count."""
+        self._attr_native_value = self._value_from_data()
+        self.async_write_ha_state()
 
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "consumption_total")
-        self._attr_name = _build_sensor_name(
-            region_config, tank_data, "Total Consumption"
-        )
-        self._attr_native_unit_of_measurement = region_config.consumption_display_unit
-        self._attr_device_class = SensorDeviceClass.GAS
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_icon = "mdi:fire"
-        self._display_factor = region_config.consumption_display_factor
-
-    @property
-    def native_value(self) -> float | None:
-        """Return total consumption in display units."""
+    def _value_from_data(self) -> int | None:
+        """Return days since last delivery."""
         tank_data = self._get_tank_data()
         if not tank_data:
             return None
 
-        return tank_data.get("consumption_total", 0.0) * self._display_factor
+        return self.coordinator.days_since_delivery(tank_data)
 
 
-class SuperiorPlusPropaneSmoothedConsumptionSensor(
-    SuperiorPlusPropaneEntity, SensorEntity
-):
+class SuperiorPlusPropaneSmoothedConsumptionSensor(SuperiorPlusPropaneSensor):
     """Total consumption with plateau steps interpolated to a linear ramp."""
 
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "consumption_smoothed")
-        self._attr_name = _build_sensor_name(
-            region_config, tank_data, "Smoothed Consumption"
-        )
-        self._attr_native_unit_of_measurement = region_config.consumption_display_unit
-        self._attr_device_class = SensorDeviceClass.GAS
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_icon = "mdi:fire-circle"
-        self._display_factor = region_config.consumption_display_factor
-        self._tank_id = tank_data["tank_id"]
-
-    @property
-    def native_value(self) -> float | None:
+    entity_description = SuperiorPlusPropaneSensorEntityDescription(
+        key="consumption_smoothed",
+        name="Smoothed Consumption",
+        unit_attr="consumption_display_unit",
+        display_factor_attr="consumption_display_factor",
+        device_class=SensorDeviceClass.GAS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:fire-circle",
+    )
+
+    def _value_from_data(self) -> float | None:
         """Return smoothed total consumption in display units."""
-        if not self._get_tank_data():
-            return None
-        return (
-            self.coordinator.get_smoothed_consumption_total(self._tank_id)
-            * self._display_factor
-        )
-
-
-class SuperiorPlusPropaneConsumptionRateSensor(SuperiorPlusPropaneEntity, SensorEntity):
-    """Consumption rate sensor showing current hourly usage."""
-
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "consumption_rate")
-        self._attr_name = _build_sensor_name(
-            region_config, tank_data, "Consumption Rate"
-        )
-        self._attr_native_unit_of_measurement = region_config.rate_display_unit
-        self._attr_device_class = None
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:speedometer"
-        self._display_factor = region_config.rate_display_factor
-
-    @property
-    def native_value(self) -> float | None:
-        """Return consumption rate in display units per hour."""
         tank_data = self._get_tank_data()
         if not tank_data:
             return None
-
-        return tank_data.get("consumption_rate", 0.0) * self._display_factor
+        smoothed = tank_data.get("consumption_smoothed")
+        if smoothed is None:
+            smoothed = self.coordinator.get_smoothed_consumption_total(self._tank_id)
+        return self._convert(smoothed)
 
 
-class SuperiorPlusPropaneDataQualitySensor(SuperiorPlusPropaneEntity, SensorEntity):
+class SuperiorPlusPropaneDataQualitySensor(SuperiorPlusPropaneSensor):
     """Data quality indicator sensor."""
 
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "data_quality")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Data Quality")
-        self._attr_device_class = None
-        self._attr_state_class = None
-        self._attr_icon = "mdi:shield-check"
+    entity_description = SuperiorPlusPropaneSensorEntityDescription(
+        key="data_quality",
+        name="Data Quality",
+        icon="mdi:shield-check",
+    )
 
-    @property
-    def native_value(self) -> str | None:
+    def _value_from_data(self) -> str | None:
         """Return the data quality status."""
         tank_data = self._get_tank_data()
         if not tank_data:
@@ -504,38 +381,25 @@ class SuperiorPlusPropaneDataQualitySensor(SuperiorPlusPropaneEntity, SensorEnti
         if not tank_data:
             return "mdi:shield-off"
 
-        quality = tank_data.get("data_quality", "Unknown")
-
-        if quality == "Good":
-            return "mdi:shield-check"
-        if quality == "Inconsistent Values":
-            return "mdi:shield-alert"
-        if quality in ("Invalid Level", "Invalid Tank Size", "Calculation Error"):
-            return "mdi:shield-off"
-        return "mdi:shield-outline"
+        return _QUALITY_ICONS.get(
+            tank_data.get("data_quality", "Unknown"), "mdi:shield-outline"
+        )
 
 
-class SuperiorPlusPropaneAveragePriceSensor(SuperiorPlusPropaneEntity, SensorEntity):
+class SuperiorPlusPropaneAveragePriceSensor(SuperiorPlusPropaneSensor):
     """Average price sensor from orders data."""
 
-    def __init__(
-        self,
-        coordinator: SuperiorPlusPropaneDataUpdateCoordinator,
-        tank_data: dict[str, Any],
-        region_config: RegionConfig,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, tank_data)
-        self._attr_unique_id = _build_unique_id(tank_data, "average_price")
-        self._attr_name = _build_sensor_name(region_config, tank_data, "Average Price")
-        self._attr_native_unit_of_measurement = region_config.price_unit
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_state_class = None
-        self._attr_icon = "mdi:cash-multiple"
-        self._price_display_factor = region_config.price_display_factor
-
-    @property
-    def native_value(self) -> float | None:
+    entity_description = SuperiorPlusPropaneSensorEntityDescription(
+        key="average_price",
+        name="Average Price",
+        unit_attr="price_unit",
+        display_factor_attr="price_display_factor",
+        round_digits=5,
+        device_class=SensorDeviceClass.MONETARY,
+        icon="mdi:cash-multiple",
+    )
+
+    def _value_from_data(self) -> float | None:
         """Return the average price from orders data."""
         if not self.coordinator.data:
             return None
@@ -544,11 +408,4 @@ class SuperiorPlusPropaneAveragePriceSensor(SuperiorPlusPropaneEntity, SensorEnt
         if not orders:
             return None
 
-        avg_price = orders.get("average_price")
-        if avg_price is None:
-            return None
-
-        try:
-            return round(float(avg_price) * self._price_display_factor, 5)
-        except (ValueError, TypeError):
-            return None
+        return self._convert(orders.get("average_price"))